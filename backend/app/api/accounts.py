@@ -1,10 +1,17 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.schemas.account import Account, AccountCreate, AccountUpdate
 from app.models.account import Account as AccountModel
 from app.database.engine import get_db
+from app.core.negotiation import NegotiatedRoute
 
-router = APIRouter(prefix="/accounts", tags=["accounts"])
+router = APIRouter(prefix="/accounts", tags=["accounts"], route_class=NegotiatedRoute)
+
+
+def _live_accounts(db: Session):
+    """Query accounts that have not been soft-deleted."""
+    return db.query(AccountModel).filter(AccountModel.deleted_at.is_(None))
 
 
 @router.post("", response_model=Account)
@@ -20,7 +27,7 @@ def create_account(account: AccountCreate, db: Session = Depends(get_db)) -> Acc
 @router.get("/{account_id}", response_model=Account)
 def get_account(account_id: int, db: Session = Depends(get_db)) -> Account:
     """Get an account by ID."""
-    account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+    account = _live_accounts(db).filter(AccountModel.id == account_id).first()
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
@@ -29,7 +36,7 @@ def get_account(account_id: int, db: Session = Depends(get_db)) -> Account:
 @router.get("", response_model=list[Account])
 def list_accounts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> list[Account]:
     """List all accounts."""
-    accounts = db.query(AccountModel).offset(skip).limit(limit).all()
+    accounts = _live_accounts(db).offset(skip).limit(limit).all()
     return accounts
 
 
@@ -40,7 +47,7 @@ def update_account(
     db: Session = Depends(get_db)
 ) -> Account:
     """Update an account."""
-    db_account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+    db_account = _live_accounts(db).filter(AccountModel.id == account_id).first()
     if not db_account:
         raise HTTPException(status_code=404, detail="Account not found")
     
@@ -56,11 +63,12 @@ def update_account(
 
 @router.delete("/{account_id}")
 def delete_account(account_id: int, db: Session = Depends(get_db)):
-    """Delete an account."""
-    db_account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+    """Soft-delete an account, leaving a tombstone for sync clients."""
+    db_account = _live_accounts(db).filter(AccountModel.id == account_id).first()
     if not db_account:
         raise HTTPException(status_code=404, detail="Account not found")
     
-    db.delete(db_account)
+    db_account.deleted_at = datetime.utcnow()
+    db.add(db_account)
     db.commit()
     return {"detail": "Account deleted successfully"}
@@ -1,17 +1,14 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.schemas.health import HealthResponse, ReadinessResponse
-from app.core.config import get_settings
-from app.database.engine import get_db
+from fastapi import APIRouter, Depends, Response
+from app.schemas.health import HealthResponse, DependencyCheck, ReadinessResponse
+from app.core.config import Settings, get_settings
+from app.core.readiness import ReadinessChecker, get_readiness_checker
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check(settings: object = Depends(get_settings)) -> HealthResponse:
+async def health_check(settings: Settings = Depends(get_settings)) -> HealthResponse:
     """Health check endpoint."""
-    settings = get_settings()
     return HealthResponse(
         status="healthy",
         app_name=settings.app_name,
@@ -21,20 +18,33 @@ async def health_check(settings: object = Depends(get_settings)) -> HealthRespon
 
 @router.get("/readiness", response_model=ReadinessResponse)
 async def readiness_check(
-    db: Session = Depends(get_db),
-    settings: object = Depends(get_settings)
+    response: Response,
+    checker: ReadinessChecker = Depends(get_readiness_checker),
+    settings: Settings = Depends(get_settings)
 ) -> ReadinessResponse:
-    """Readiness check endpoint - validates database connectivity."""
-    settings = get_settings()
-    
-    try:
-        db.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception:
-        db_status = "disconnected"
-    
+    """Readiness check endpoint - serves the latest background dependency checks.
+
+    Responds with 503 until the first round of checks has passed, and
+    whenever a critical dependency (the primary database) is down.
+    """
+    status = checker.status
+    database = next((check for check in status.checks if check.name == "database"), None)
+    if not status.ready:
+        response.status_code = 503
+
     return ReadinessResponse(
-        status="ready" if db_status == "connected" else "not_ready",
-        database=db_status,
-        app_name=settings.app_name
+        status="ready" if status.ready else "not_ready",
+        database="unknown" if database is None else "connected" if database.up else "disconnected",
+        app_name=settings.app_name,
+        checked_at=status.checked_at,
+        checks=[
+            DependencyCheck(
+                name=check.name,
+                status="up" if check.up else "down",
+                critical=check.critical,
+                latency_ms=round(check.latency_ms, 2),
+                error=check.error,
+            )
+            for check in status.checks
+        ],
     )
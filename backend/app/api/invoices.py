@@ -0,0 +1,144 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.schemas.invoice import (
+    Invoice, InvoiceCreate, InvoiceUpdate, InvoiceGenerateRequest, InvoiceGenerateResult,
+)
+from app.models.invoice import Invoice as InvoiceModel
+from app.models.job import Job as JobModel
+from app.core.config import Settings, get_settings
+from app.core.tenant import get_tenant_id
+from app.core.negotiation import NegotiatedRoute
+from app.database.engine import get_db
+from app.database.invoice_generation import generate_invoices
+from app.database.partitions import hot_partition_cutoff
+from app.database.query_cache import QueryResultCache, get_query_cache
+from app.database.repository import TenantRepository
+
+router = APIRouter(prefix="/invoices", tags=["invoices"], route_class=NegotiatedRoute)
+
+
+def get_invoice_repository(
+    db: Session = Depends(get_db),
+    tenant_id: int = Depends(get_tenant_id)
+) -> TenantRepository[InvoiceModel]:
+    """Dependency for the current tenant's invoices."""
+    return TenantRepository(db, InvoiceModel, tenant_id)
+
+
+def _invoices_query(invoices: TenantRepository[InvoiceModel], settings: Settings, history: bool):
+    """Query invoices, restricted to the hot partitions unless history is requested."""
+    query = invoices.query()
+    if not history:
+        query = query.filter(InvoiceModel.created_at >= hot_partition_cutoff(settings.hot_partition_months))
+    return query
+
+
+@router.post("", response_model=Invoice)
+def create_invoice(
+    invoice: InvoiceCreate,
+    invoices: TenantRepository[InvoiceModel] = Depends(get_invoice_repository),
+    settings: Settings = Depends(get_settings)
+) -> Invoice:
+    """Create a new invoice.
+
+    Numbers starting with `invoice_number_prefix` are reserved for generated invoices.
+    """
+    if invoice.invoice_number.startswith(settings.invoice_number_prefix):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invoice numbers starting with {settings.invoice_number_prefix!r} are reserved",
+        )
+    jobs = TenantRepository(invoices.db, JobModel, invoices.tenant_id)
+    # Held until the invoice commits, so archival cannot remove the job underneath it.
+    if not jobs.get(invoice.job_id, key_share=True):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return invoices.create(invoice.model_dump())
+
+
+@router.post(":generate", response_model=InvoiceGenerateResult)
+def generate_invoices_for_completed_jobs(
+    request: InvoiceGenerateRequest,
+    db: Session = Depends(get_db),
+    tenant_id: int = Depends(get_tenant_id),
+    settings: Settings = Depends(get_settings)
+) -> InvoiceGenerateResult:
+    """Create draft invoices for the account's completed jobs that have none yet."""
+    try:
+        result = generate_invoices(
+            db,
+            tenant_id,
+            amount=request.amount,
+            tax_rate=request.tax_rate,
+            job_amounts=request.job_amounts,
+            completed_from=request.completed_from,
+            completed_to=request.completed_to,
+            due_in_days=request.due_in_days,
+            number_prefix=settings.invoice_number_prefix,
+            chunk_size=settings.invoice_generation_chunk_size,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return InvoiceGenerateResult(
+        created=result.created,
+        first_invoice_number=result.first_invoice_number,
+        last_invoice_number=result.last_invoice_number,
+    )
+
+
+@router.get("/{invoice_id}", response_model=Invoice)
+def get_invoice(
+    invoice_id: int,
+    invoices: TenantRepository[InvoiceModel] = Depends(get_invoice_repository)
+) -> Invoice:
+    """Get an invoice by ID, however old it is."""
+    invoice = invoices.get(invoice_id)
+    if not invoice:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    return invoice
+
+
+@router.get("", response_model=list[Invoice])
+def list_invoices(
+    skip: int = 0,
+    limit: int = 100,
+    history: bool = False,
+    invoices: TenantRepository[InvoiceModel] = Depends(get_invoice_repository),
+    settings: Settings = Depends(get_settings),
+    cache: QueryResultCache = Depends(get_query_cache)
+) -> list[Invoice]:
+    """List invoices, by default only those in the hot partitions.
+
+    Results are cached until a write to the underlying tables commits.
+    """
+    query = _invoices_query(invoices, settings, history).order_by(InvoiceModel.id).offset(skip).limit(limit)
+    return cache.get_or_compute(query.statement, lambda: [Invoice.model_validate(row) for row in query.all()])
+
+
+@router.patch("/{invoice_id}", response_model=Invoice)
+def update_invoice(
+    invoice_id: int,
+    invoice_update: InvoiceUpdate,
+    invoices: TenantRepository[InvoiceModel] = Depends(get_invoice_repository)
+) -> Invoice:
+    """Update an invoice."""
+    db_invoice = invoices.get(invoice_id)
+    if not db_invoice:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    
+    return invoices.update(db_invoice, invoice_update.model_dump(exclude_unset=True))
+
+
+@router.delete("/{invoice_id}")
+def delete_invoice(
+    invoice_id: int,
+    invoices: TenantRepository[InvoiceModel] = Depends(get_invoice_repository)
+):
+    """Delete an invoice."""
+    db_invoice = invoices.get(invoice_id)
+    if not db_invoice:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    
+    invoices.delete(db_invoice)
+    return {"detail": "Invoice deleted successfully"}
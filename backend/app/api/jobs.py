@@ -0,0 +1,170 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+from app.schemas.job import Job, JobCreate, JobUpdate, JobBatchUpdate, JobBatchUpdateResult
+from app.models.job import Job as JobModel
+from app.models.technician import Technician as TechnicianModel
+from app.core.config import Settings, get_settings
+from app.core.tenant import get_tenant_id
+from app.core.negotiation import NegotiatedRoute
+from app.database.engine import get_db
+from app.database.coalescer import WriteCoalescer
+from app.database.partitions import hot_partition_cutoff
+from app.database.query_cache import QueryResultCache, get_query_cache
+from app.database.repository import TenantRepository
+
+router = APIRouter(prefix="/jobs", tags=["jobs"], route_class=NegotiatedRoute)
+
+
+def get_job_repository(
+    db: Session = Depends(get_db),
+    tenant_id: int = Depends(get_tenant_id)
+) -> TenantRepository[JobModel]:
+    """Dependency for the current tenant's jobs."""
+    return TenantRepository(db, JobModel, tenant_id)
+
+
+def get_technician_repository(
+    db: Session = Depends(get_db),
+    tenant_id: int = Depends(get_tenant_id)
+) -> TenantRepository[TechnicianModel]:
+    """Dependency for the current tenant's technicians."""
+    return TenantRepository(db, TechnicianModel, tenant_id)
+
+
+def get_job_coalescer(request: Request) -> WriteCoalescer:
+    """Dependency for the application's job update coalescer."""
+    return request.app.state.job_coalescer
+
+
+def _jobs_query(jobs: TenantRepository[JobModel], settings: Settings, history: bool):
+    """Query jobs, restricted to the hot partitions unless history is requested."""
+    query = jobs.query()
+    if not history:
+        query = query.filter(JobModel.created_at >= hot_partition_cutoff(settings.hot_partition_months))
+    return query
+
+
+def _unknown_technicians(technicians: TenantRepository[TechnicianModel], technician_ids: set[int]) -> set[int]:
+    """Return the IDs among `technician_ids` that are not technicians of the tenant.
+
+    Ends the session's transaction, so no connection is held while the
+    caller waits for its coalesced write.
+    """
+    if not technician_ids:
+        return set()
+    try:
+        known = technicians.query().filter(TechnicianModel.id.in_(technician_ids)).with_entities(TechnicianModel.id)
+        return technician_ids - {technician_id for (technician_id,) in known}
+    finally:
+        technicians.db.rollback()
+
+
+@router.post("", response_model=Job)
+def create_job(job: JobCreate, jobs: TenantRepository[JobModel] = Depends(get_job_repository)) -> Job:
+    """Create a new job."""
+    if job.technician_id is not None:
+        technicians = TenantRepository(jobs.db, TechnicianModel, jobs.tenant_id)
+        # Held until the job commits, so the technician cannot be removed meanwhile.
+        if not technicians.get(job.technician_id, key_share=True):
+            raise HTTPException(status_code=404, detail="Technician not found")
+    return jobs.create(job.model_dump())
+
+
+@router.get("/{job_id}", response_model=Job)
+def get_job(job_id: int, jobs: TenantRepository[JobModel] = Depends(get_job_repository)) -> Job:
+    """Get a job by ID, however old it is."""
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("", response_model=list[Job])
+def list_jobs(
+    skip: int = 0,
+    limit: int = 100,
+    history: bool = False,
+    jobs: TenantRepository[JobModel] = Depends(get_job_repository),
+    settings: Settings = Depends(get_settings),
+    cache: QueryResultCache = Depends(get_query_cache)
+) -> list[Job]:
+    """List jobs, by default only those in the hot partitions.
+
+    Results are cached until a write to the underlying tables commits.
+    """
+    query = _jobs_query(jobs, settings, history).order_by(JobModel.id).offset(skip).limit(limit)
+    return cache.get_or_compute(query.statement, lambda: [Job.model_validate(row) for row in query.all()])
+
+
+@router.patch(":batch", response_model=JobBatchUpdateResult)
+async def batch_update_jobs(
+    batch: JobBatchUpdate,
+    tenant_id: int = Depends(get_tenant_id),
+    technicians: TenantRepository[TechnicianModel] = Depends(get_technician_repository),
+    coalescer: WriteCoalescer = Depends(get_job_coalescer)
+) -> JobBatchUpdateResult:
+    """Update many jobs at once; updates to the same job are merged by `updated_at`.
+
+    Jobs whose update could not be written, or that would be assigned a
+    technician of another account, are listed in `failed`.
+    """
+    unknown = await asyncio.to_thread(
+        _unknown_technicians,
+        technicians,
+        {item.technician_id for item in batch.updates if item.technician_id is not None},
+    )
+    accepted = [item for item in batch.updates if item.technician_id not in unknown]
+    results = await asyncio.gather(*(
+        coalescer.submit(
+            tenant_id,
+            item.id,
+            item.model_dump(exclude_unset=True, exclude={"id", "updated_at"}),
+            item.updated_at,
+        )
+        for item in accepted
+    ), return_exceptions=True)
+    updated = {}
+    not_found = []
+    failed = [item.id for item in batch.updates if item.technician_id in unknown]
+    for item, job in zip(accepted, results):
+        if isinstance(job, Exception):
+            failed.append(item.id)
+        elif job is None:
+            not_found.append(item.id)
+        else:
+            updated[job.id] = job
+    return JobBatchUpdateResult(updated=list(updated.values()), not_found=not_found, failed=failed)
+
+
+@router.patch("/{job_id}", response_model=Job)
+async def update_job(
+    job_id: int,
+    job_update: JobUpdate,
+    tenant_id: int = Depends(get_tenant_id),
+    technicians: TenantRepository[TechnicianModel] = Depends(get_technician_repository),
+    coalescer: WriteCoalescer = Depends(get_job_coalescer)
+) -> Job:
+    """Update a job.
+
+    Concurrent updates are coalesced into batched writes; the response is
+    returned once the update is committed.
+    """
+    if job_update.technician_id is not None:
+        if await asyncio.to_thread(_unknown_technicians, technicians, {job_update.technician_id}):
+            raise HTTPException(status_code=404, detail="Technician not found")
+    job = await coalescer.submit(tenant_id, job_id, job_update.model_dump(exclude_unset=True))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.delete("/{job_id}")
+def delete_job(job_id: int, jobs: TenantRepository[JobModel] = Depends(get_job_repository)):
+    """Delete a job."""
+    db_job = jobs.get(job_id)
+    if not db_job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    jobs.delete(db_job)
+    return {"detail": "Job deleted successfully"}
@@ -0,0 +1,56 @@
+import secrets
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.schemas.profiling import ProfileSummary
+from app.core.config import Settings, get_settings
+from app.core.profiling import ProfileStore, RequestProfile, get_profile_store
+
+
+def require_admin(
+    x_admin_key: str | None = Header(None),
+    settings: Settings = Depends(get_settings)
+) -> None:
+    """Dependency rejecting requests without the admin API key."""
+    if not settings.admin_api_key or not x_admin_key or not secrets.compare_digest(
+        x_admin_key, settings.admin_api_key
+    ):
+        raise HTTPException(status_code=403, detail="Admin API key required")
+
+
+router = APIRouter(prefix="/admin/profiles", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+def _get_profile(profile_id: str, store: ProfileStore) -> RequestProfile:
+    profile = store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
+
+
+@router.get("", response_model=list[ProfileSummary])
+def list_profiles(store: ProfileStore = Depends(get_profile_store)) -> list[ProfileSummary]:
+    """List captured request profiles, newest first."""
+    return [
+        ProfileSummary(
+            id=profile.id,
+            method=profile.method,
+            path=profile.path,
+            started_at=profile.started_at,
+            duration_ms=profile.duration_ms,
+            cpu_samples=sum(profile.samples.values()),
+            allocated_bytes=sum(profile.allocations.values()),
+        )
+        for profile in store.list()
+    ]
+
+
+@router.get("/{profile_id}/cpu", response_class=PlainTextResponse)
+def download_cpu_profile(profile_id: str, store: ProfileStore = Depends(get_profile_store)) -> str:
+    """Download sampled CPU stacks in collapsed-stack (flamegraph) format."""
+    return _get_profile(profile_id, store).folded_samples()
+
+
+@router.get("/{profile_id}/allocations", response_class=PlainTextResponse)
+def download_allocation_profile(profile_id: str, store: ProfileStore = Depends(get_profile_store)) -> str:
+    """Download allocated bytes per traceback in collapsed-stack (flamegraph) format."""
+    return _get_profile(profile_id, store).folded_allocations()
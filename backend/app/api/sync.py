@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.schemas.sync import SyncChanges
+from app.core.tenant import get_tenant_id
+from app.core.negotiation import NegotiatedRoute
+from app.database.engine import get_db
+from app.database.sync import TOKEN_PATTERN, changes_since
+
+router = APIRouter(prefix="/sync", tags=["sync"], route_class=NegotiatedRoute)
+
+
+@router.get("", response_model=SyncChanges)
+def sync_changes(
+    since: str = Query("0", pattern=TOKEN_PATTERN),
+    limit: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    tenant_id: int = Depends(get_tenant_id)
+) -> SyncChanges:
+    """Get the account's rows changed or deleted after the `since` token.
+
+    Start with `since=0` for a full download, then pass the returned
+    `next_token` to receive only later changes. Tokens are opaque.
+    """
+    page = changes_since(db, tenant_id, since, limit)
+    return SyncChanges(**page.rows, next_token=page.next_token, has_more=page.has_more)
@@ -0,0 +1,85 @@
+import gzip
+from functools import lru_cache
+from starlette.datastructures import Headers, MutableHeaders
+
+
+@lru_cache()
+def _brotli():
+    """The brotli module, or None when the optional dependency is missing."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip.
+
+    Brotli is preferred when the client accepts it and the optional
+    `brotli` package is installed, otherwise gzip is used. Responses smaller
+    than `minimum_size`, already encoded, or streamed in several chunks are
+    sent unchanged.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose_encoding(self, accept_encoding: str) -> str | None:
+        accepted = set()
+        for token in accept_encoding.split(","):
+            coding, *params = [piece.strip() for piece in token.split(";")]
+            refused = any(param.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000") for param in params)
+            if coding and not refused:
+                accepted.add(coding.lower())
+        if "br" in accepted and _brotli() is not None:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return _brotli().compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def compressing_send(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if message.get("more_body") or len(body) < self.minimum_size or "content-encoding" in headers:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = self._compress(encoding, body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, compressing_send)
@@ -8,6 +8,7 @@ class Settings(BaseSettings):
     # Database configuration
     database_url: str
     database_echo: bool = False
+    database_replica_urls: list[str] = []
     
     # FSM API configuration
     fsm_api_key: str
@@ -20,6 +21,46 @@ class Settings(BaseSettings):
     app_name: str = "Field Solutions Backend"
     debug: bool = False
     
+    # Partitioning and archival configuration
+    hot_partition_months: int = 3
+    partition_months_ahead: int = 3
+    archive_after_months: int = 12
+    archive_dir: str = "archive"
+    
+    # Multi-tenancy configuration
+    maintenance_role: str | None = None
+    
+    # Response compression configuration
+    response_compression_enabled: bool = False
+    response_compression_minimum_size: int = 1024
+    
+    # Admin configuration
+    admin_api_key: str | None = None
+    
+    # Request profiling configuration
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.0
+    profiling_interval_ms: int = 5
+    profiling_traceback_depth: int = 25
+    profiling_max_profiles: int = 20
+    
+    # Query result cache configuration
+    query_cache_enabled: bool = False
+    query_cache_max_bytes: int = 64 * 1024 * 1024
+    query_cache_ttl_seconds: float = 300.0
+    
+    # Invoice generation configuration
+    invoice_number_prefix: str = "INV-"
+    invoice_generation_chunk_size: int = 5000
+    
+    # Readiness check configuration
+    readiness_check_interval_seconds: float = 10.0
+    readiness_check_timeout_seconds: float = 2.0
+    
+    # Job write coalescing configuration
+    job_write_coalesce_window_ms: int = 5
+    job_write_coalesce_max_batch: int = 500
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,193 @@
+import inspect
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache, wraps
+from typing import Any, Callable, Coroutine, get_args, get_origin
+from fastapi import HTTPException, Request, Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# Response encoding negotiated for the request being handled.
+_response_format: ContextVar[str] = ContextVar("response_format", default="json")
+
+
+@lru_cache()
+def _msgpack():
+    """The msgpack module, or None when the optional dependency is missing."""
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+@lru_cache()
+def _pack_default() -> Callable[[Any], Any]:
+    """The msgpack `default` hook, with the names it uses bound once.
+
+    Aware datetimes are packed as Timestamps by msgpack itself
+    (`datetime=True`); the hook only makes naive ones aware, and turns
+    decimals into their string form, exactly as JSON carries them.
+    """
+    from_datetime = _msgpack().Timestamp.from_datetime
+    combine = datetime.combine
+    utc = timezone.utc
+
+    def pack_default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                # Naive datetimes are stored as UTC; `combine` is much cheaper than `replace`.
+                return combine(value, value.time(), utc)
+            return from_datetime(value)
+        if isinstance(value, Decimal):
+            return str(value)
+        raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack")
+
+    return pack_default
+
+
+def packb(content: Any) -> bytes:
+    """Encode Python response data as MessagePack."""
+    return _msgpack().packb(content, use_bin_type=True, datetime=True, default=_pack_default())
+
+
+def unpackb(body: bytes) -> Any:
+    """Decode a MessagePack body; Timestamps become aware UTC datetimes."""
+    return _msgpack().unpackb(body, raw=False, timestamp=3)
+
+
+def _media_type(value: str) -> str:
+    return value.split(";", 1)[0].strip().lower()
+
+
+def accepts_msgpack(accept: str | None) -> bool:
+    """Whether an Accept header lists a MessagePack media type with a non-zero quality."""
+    if not accept:
+        return False
+    for part in accept.split(","):
+        media_type, *params = [piece.strip() for piece in part.split(";")]
+        if media_type.lower() not in MSGPACK_MEDIA_TYPES:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class NegotiatedResponse(JSONResponse):
+    """JSON response that renders as MessagePack when the request asked for it."""
+
+    def __init__(self, content: Any, status_code: int = 200, **kwargs):
+        if _response_format.get() == "msgpack":
+            self.media_type = MSGPACK_MEDIA_TYPES[0]
+        super().__init__(content, status_code, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPES[0]:
+            return packb(content)
+        return super().render(content)
+
+
+class MsgPackRequest(Request):
+    """Request whose MessagePack body is presented to FastAPI as parsed JSON."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_msgpack_body"):
+            self._msgpack_body = unpackb(await self.body())
+        return self._msgpack_body
+
+
+class NegotiatedRoute(APIRoute):
+    """Route speaking JSON or MessagePack, chosen by Content-Type and Accept.
+
+    Request bodies sent as `application/msgpack` are decoded and validated
+    exactly like JSON bodies. Responses default to `NegotiatedResponse`,
+    which encodes the response model as MessagePack when the client's
+    Accept header asks for it. The model is then dumped in Python mode, so
+    datetimes travel as MessagePack Timestamps rather than as strings.
+    Without the optional `msgpack` package, MessagePack bodies are rejected
+    with 415 and responses stay JSON.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], *, response_class: Any = None, **kwargs):
+        if response_class is None or isinstance(response_class, DefaultPlaceholder):
+            response_class = NegotiatedResponse
+        super().__init__(path, self._negotiated_endpoint(endpoint), response_class=response_class, **kwargs)
+        self._response_adapter = TypeAdapter(self.response_model) if self.response_model is not None else None
+
+    def _is_response_model(self, result: Any) -> bool:
+        """Whether `result` already is the response model, or a list of it."""
+        model = self.response_model
+        if get_origin(model) is list:
+            (model,) = get_args(model)
+            if not isinstance(result, list):
+                return False
+        else:
+            result = [result]
+        return isinstance(model, type) and issubclass(model, BaseModel) and all(
+            isinstance(item, model) for item in result
+        )
+
+    def _msgpack_response(self, result: Any) -> Any:
+        """Build MessagePack responses from the response model dumped in Python mode.
+
+        FastAPI would dump it in JSON mode, turning datetimes and decimals
+        into strings before `NegotiatedResponse` ever sees them. Returning a
+        response skips FastAPI's own validation, so results that are not the
+        response model yet (ORM rows) are validated here, once.
+        """
+        if _response_format.get() != "msgpack" or isinstance(result, Response) or self._response_adapter is None:
+            return result
+        adapter = self._response_adapter
+        if not self._is_response_model(result):
+            result = adapter.validate_python(result, from_attributes=True)
+        content = adapter.dump_python(result, mode="python")
+        return NegotiatedResponse(content, status_code=self.status_code or 200)
+
+    def _negotiated_endpoint(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        # `wraps` keeps the signature FastAPI resolves dependencies from.
+        if inspect.iscoroutinefunction(endpoint):
+            @wraps(endpoint)
+            async def negotiated_endpoint(*args: Any, **kwargs: Any) -> Any:
+                return self._msgpack_response(await endpoint(*args, **kwargs))
+        else:
+            @wraps(endpoint)
+            def negotiated_endpoint(*args: Any, **kwargs: Any) -> Any:
+                return self._msgpack_response(endpoint(*args, **kwargs))
+        return negotiated_endpoint
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            content_type = request.headers.get("content-type")
+            if content_type and _media_type(content_type) in MSGPACK_MEDIA_TYPES:
+                if _msgpack() is None:
+                    raise HTTPException(status_code=415, detail="MessagePack is not supported")
+                scope = dict(request.scope)
+                scope["headers"] = [
+                    (name, b"application/json" if name == b"content-type" else value)
+                    for name, value in request.scope["headers"]
+                ]
+                request = MsgPackRequest(scope, request.receive)
+
+            wants_msgpack = _msgpack() is not None and accepts_msgpack(request.headers.get("accept"))
+            token = _response_format.set("msgpack" if wants_msgpack else "json")
+            try:
+                response = await handler(request)
+            finally:
+                _response_format.reset(token)
+            response.headers.append("Vary", "Accept")
+            return response
+
+        return negotiated_handler
@@ -0,0 +1,171 @@
+import asyncio
+import random
+import secrets
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from fastapi import Request
+from app.core.config import Settings
+
+PROFILE_HEADER = "X-Profile-Request"
+
+# Innermost frames in these files mean the thread is idle, not doing request work.
+_IDLE_FILES = ("threading.py", "queue.py", "selectors.py", "base_events.py", "thread.py")
+
+
+@dataclass
+class RequestProfile:
+    """CPU samples and allocation statistics captured for one request."""
+    id: str
+    method: str
+    path: str
+    started_at: datetime
+    duration_ms: float = 0.0
+    samples: Counter = field(default_factory=Counter)
+    allocations: Counter = field(default_factory=Counter)
+
+    def folded_samples(self) -> str:
+        """CPU samples in collapsed-stack format, as consumed by flamegraph.pl and speedscope."""
+        return _fold(self.samples)
+
+    def folded_allocations(self) -> str:
+        """Bytes still allocated at the end of the request, in collapsed-stack format."""
+        return _fold(self.allocations)
+
+
+def _fold(stacks: Counter) -> str:
+    return "".join(f"{stack} {weight}\n" for stack, weight in stacks.most_common())
+
+
+class StackSampler(threading.Thread):
+    """Samples the Python stacks of all other threads at a fixed interval."""
+
+    def __init__(self, interval: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        while not self._stopped.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or frame.f_code.co_filename.endswith(_IDLE_FILES):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self) -> Counter:
+        """Stop sampling and return the collected samples."""
+        self._stopped.set()
+        self.join()
+        return self.samples
+
+
+class ProfileStore:
+    """Keeps the most recent request profiles in memory for download."""
+
+    def __init__(self, max_profiles: int):
+        self._profiles: deque[RequestProfile] = deque(maxlen=max_profiles)
+
+    def add(self, profile: RequestProfile) -> None:
+        self._profiles.append(profile)
+
+    def list(self) -> list[RequestProfile]:
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        return next((profile for profile in self._profiles if profile.id == profile_id), None)
+
+
+def get_profile_store(request: Request) -> ProfileStore:
+    """Dependency for the application's profile store."""
+    return request.app.state.profile_store
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling sampled requests.
+
+    A request is profiled when it carries `X-Profile-Request` set to the
+    admin API key, or at random with probability `profiling_sample_rate`.
+    Only one request is profiled at a time, since both the stack sampler
+    and tracemalloc observe the whole process. Once the response is sent,
+    the snapshot is taken and aggregated on a worker thread, so the event
+    loop keeps serving other requests meanwhile. Only installed when
+    `profiling_enabled` is set, so it costs nothing otherwise.
+    """
+
+    def __init__(self, app, settings: Settings, store: ProfileStore):
+        self.app = app
+        self.settings = settings
+        self.store = store
+        self._lock = threading.Lock()
+        self._finishing: set[asyncio.Task] = set()
+
+    def _wants_profile(self, scope) -> bool:
+        admin_key = self.settings.admin_api_key
+        if admin_key:
+            header = PROFILE_HEADER.lower().encode()
+            for name, value in scope["headers"]:
+                if name == header:
+                    return secrets.compare_digest(value, admin_key.encode())
+        rate = self.settings.profiling_sample_rate
+        return rate > 0 and random.random() < rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wants_profile(scope) or not self._lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            id=uuid.uuid4().hex,
+            method=scope["method"],
+            path=scope["path"],
+            started_at=datetime.utcnow(),
+        )
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(self.settings.profiling_traceback_depth)
+        sampler = StackSampler(self.settings.profiling_interval_ms / 1000)
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profile.duration_ms = (time.perf_counter() - start) * 1000
+            task = asyncio.get_running_loop().create_task(
+                asyncio.to_thread(self._finish, profile, sampler, started_tracing)
+            )
+            self._finishing.add(task)
+            task.add_done_callback(self._finishing.discard)
+
+    def _finish(self, profile: RequestProfile, sampler: StackSampler, started_tracing: bool) -> None:
+        """Stop profiling and aggregate the results; runs off the event loop."""
+        try:
+            profile.samples = sampler.stop()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+        finally:
+            self._lock.release()
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        for stat in snapshot.statistics("traceback"):
+            stack = ";".join(f"{frame.filename}:{frame.lineno}" for frame in stat.traceback)
+            profile.allocations[stack] += stat.size
+        self.store.add(profile)
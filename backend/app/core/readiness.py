@@ -0,0 +1,192 @@
+import asyncio
+import math
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+from fastapi import Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+from app.core.config import Settings
+
+
+@dataclass
+class Dependency:
+    """A dependency probed by the readiness checker.
+
+    `probe` blocks until the dependency answers and raises if it is
+    unavailable. The service is only ready while every critical dependency is up.
+    """
+    name: str
+    probe: Callable[[], None]
+    critical: bool = True
+
+
+@dataclass
+class CheckResult:
+    """Outcome of probing one dependency."""
+    name: str
+    up: bool
+    critical: bool
+    latency_ms: float
+    error: str | None = None
+
+
+@dataclass
+class ReadinessStatus:
+    """Outcome of one round of dependency checks."""
+    checked_at: datetime | None = None
+    checks: list[CheckResult] = field(default_factory=list)
+
+    @property
+    def ready(self) -> bool:
+        return self.checked_at is not None and all(check.up for check in self.checks if check.critical)
+
+
+def _database_probe(engine: Engine) -> Callable[[], None]:
+    def probe() -> None:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    return probe
+
+
+def _http_probe(url: str, timeout: float) -> Callable[[], None]:
+    def probe() -> None:
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method="HEAD"), timeout=timeout):
+                pass
+        except urllib.error.HTTPError as exc:
+            # Any answer short of a server error means the API is reachable.
+            if exc.code >= 500:
+                raise
+    return probe
+
+
+def _probe_engine(url: str, timeout: float) -> Engine:
+    """Engine with no pool of its own, so probes never hold connections between checks.
+
+    `connect_timeout` only bounds connecting; the statement timeout bounds
+    the probe query, and TCP keepalives drop a connection whose server
+    stopped answering, so a stuck probe thread is eventually released.
+    """
+    seconds = max(1, math.ceil(timeout))
+    connect_args = {}
+    if url.startswith("postgresql"):
+        connect_args = {
+            "connect_timeout": seconds,
+            "options": f"-c statement_timeout={seconds * 1000}",
+            "keepalives": 1,
+            "keepalives_idle": seconds,
+            "keepalives_interval": seconds,
+            "keepalives_count": 3,
+        }
+    return create_engine(url, poolclass=NullPool, connect_args=connect_args)
+
+
+class ReadinessChecker:
+    """Probes the service's dependencies in the background at a fixed interval.
+
+    Each round probes every dependency concurrently on the checker's own
+    threads and connections, with a per-check timeout, and replaces the
+    cached `status` once all checks are done. Readiness requests only read
+    that cached status, so they never wait on or compete with request
+    traffic for pooled database connections.
+
+    A timed-out probe keeps running on its thread. Until it returns, later
+    rounds report that dependency as timed out instead of probing it again,
+    so each dependency occupies at most one thread.
+    """
+
+    def __init__(self, dependencies: list[Dependency], interval: float, timeout: float):
+        self.dependencies = dependencies
+        self.interval = interval
+        self.timeout = timeout
+        self.status = ReadinessStatus()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(dependencies)), thread_name_prefix="readiness")
+        self._task: asyncio.Task | None = None
+        self._engines: list[Engine] = []
+        # Latest probe of each dependency and when it started.
+        self._probes: dict[str, tuple[Future, float]] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ReadinessChecker":
+        """Check the primary database, each read replica and the FSM API."""
+        timeout = settings.readiness_check_timeout_seconds
+        engines = [_probe_engine(url, timeout) for url in [settings.database_url, *settings.database_replica_urls]]
+        dependencies = [Dependency("database", _database_probe(engines[0]))]
+        dependencies += [
+            Dependency(f"replica_{index}", _database_probe(engine), critical=False)
+            for index, engine in enumerate(engines[1:], start=1)
+        ]
+        dependencies.append(Dependency("fsm_api", _http_probe(settings.fsm_api_url, timeout), critical=False))
+        checker = cls(dependencies, settings.readiness_check_interval_seconds, timeout)
+        checker._engines = engines
+        return checker
+
+    async def _check(self, dependency: Dependency) -> CheckResult:
+        probe = self._probes.get(dependency.name)
+        if probe is not None and not probe[0].done():
+            return CheckResult(
+                name=dependency.name,
+                up=False,
+                critical=dependency.critical,
+                latency_ms=(time.perf_counter() - probe[1]) * 1000,
+                error="timeout",
+            )
+
+        start = time.perf_counter()
+        future = self._executor.submit(dependency.probe)
+        self._probes[dependency.name] = (future, start)
+        error = None
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            error = "timeout"
+        except Exception as exc:
+            # Only the exception type, so connection details never reach the response.
+            error = type(exc).__name__
+        return CheckResult(
+            name=dependency.name,
+            up=error is None,
+            critical=dependency.critical,
+            latency_ms=(time.perf_counter() - start) * 1000,
+            error=error,
+        )
+
+    async def check(self) -> ReadinessStatus:
+        """Probe all dependencies concurrently and cache the result."""
+        checks = await asyncio.gather(*(self._check(dependency) for dependency in self.dependencies))
+        self.status = ReadinessStatus(checked_at=datetime.utcnow(), checks=list(checks))
+        return self.status
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start checking in the background; the first round begins immediately."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop checking and release the checker's threads and engines."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for engine in self._engines:
+            engine.dispose()
+
+
+def get_readiness_checker(request: Request) -> ReadinessChecker:
+    """Dependency for the application's readiness checker."""
+    return request.app.state.readiness_checker
@@ -0,0 +1,26 @@
+from fastapi import Depends, Header, HTTPException
+from sqlalchemy.orm import Session
+from app.database.engine import get_db
+from app.models.account import Account
+
+TENANT_HEADER = "X-Account-ID"
+
+
+def get_tenant_id(
+    x_account_id: int = Header(..., alias=TENANT_HEADER),
+    db: Session = Depends(get_db)
+) -> int:
+    """Dependency resolving the request's tenant from the X-Account-ID header.
+
+    Only existing, non-deleted accounts are accepted. The header itself is
+    trusted as sent, so this service must sit behind an authentication
+    layer that sets it for the authenticated caller and strips any value
+    supplied by clients.
+    """
+    account = db.query(Account.id).filter(Account.id == x_account_id, Account.deleted_at.is_(None)).first()
+    # End the lookup's transaction so the connection returns to the pool and
+    # the request's next transaction starts scoped to the tenant.
+    db.rollback()
+    if account is None:
+        raise HTTPException(status_code=403, detail="Unknown account")
+    return x_account_id
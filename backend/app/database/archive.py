@@ -0,0 +1,196 @@
+import enum
+import os
+from datetime import datetime
+from sqlalchemy import (
+    event, select, delete, insert, exists, table, column,
+    BigInteger, Boolean, DateTime, Enum, Integer, Numeric, String, Text,
+)
+from sqlalchemy.orm import Session
+from app.database.partitions import month_start, add_months
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.job import Job, JobStatus
+
+ARCHIVE_TARGETS = ("parquet", "cold")
+
+# Session.info key holding Parquet files written under a temporary name until commit.
+PENDING_FILES_KEY = "pending_archive_files"
+
+
+def archive_cutoff(older_than_months: int, now: datetime | None = None) -> datetime:
+    """Rows created before this month-aligned instant are eligible for archival."""
+    return add_months(month_start(now or datetime.utcnow()), -older_than_months)
+
+
+def _closed_invoices(cutoff: datetime):
+    return (
+        Invoice.status == InvoiceStatus.PAID,
+        Invoice.created_at < cutoff,
+    )
+
+
+def _closed_jobs(cutoff: datetime):
+    # Jobs that still have a live invoice stay hot alongside it.
+    return (
+        Job.status.in_([JobStatus.COMPLETED, JobStatus.CANCELLED]),
+        Job.created_at < cutoff,
+        ~exists().where(Invoice.job_id == Job.id, Invoice.deleted_at.is_(None)),
+    )
+
+
+def _arrow_schema(pa, source):
+    """Fixed Parquet schema for a table, so every batch is written with the same types."""
+    def arrow_type(sql_type):
+        if isinstance(sql_type, BigInteger):
+            return pa.int64()
+        if isinstance(sql_type, Integer):
+            return pa.int32()
+        if isinstance(sql_type, Numeric):
+            return pa.decimal128(sql_type.precision, sql_type.scale)
+        if isinstance(sql_type, DateTime):
+            return pa.timestamp("us")
+        if isinstance(sql_type, Boolean):
+            return pa.bool_()
+        if isinstance(sql_type, (Enum, String, Text)):
+            return pa.string()
+        raise TypeError(f"No Parquet type for {source.name}.{sql_type!r}")
+
+    return pa.schema([pa.field(c.name, arrow_type(c.type), nullable=c.nullable) for c in source.c])
+
+
+def _move_to_cold(db: Session, model, criteria) -> list[int]:
+    """Move rows into `<table>_archive` with a single DELETE ... RETURNING; return their ids."""
+    source = model.__table__
+    target = table(f"{source.name}_archive", *[column(c.name) for c in source.c])
+    moved = delete(source).where(*criteria).returning(*source.c).cte("moved")
+    statement = insert(target).from_select([c.name for c in source.c], select(moved)).returning(target.c.id)
+    return list(db.scalars(statement))
+
+
+def _publish_files(session: Session) -> None:
+    for temp_path, path in session.info[PENDING_FILES_KEY]:
+        os.replace(temp_path, path)
+    session.info[PENDING_FILES_KEY].clear()
+
+
+def _discard_files(session: Session) -> None:
+    for temp_path, path in session.info[PENDING_FILES_KEY]:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    session.info[PENDING_FILES_KEY].clear()
+
+
+def _publish_on_commit(db: Session, temp_path: str, path: str) -> None:
+    """Move a finished archive file into place once the transaction commits; drop it on rollback."""
+    if PENDING_FILES_KEY not in db.info:
+        db.info[PENDING_FILES_KEY] = []
+        event.listen(db, "after_commit", _publish_files)
+        event.listen(db, "after_rollback", _discard_files)
+    db.info[PENDING_FILES_KEY].append((temp_path, path))
+
+
+def _move_to_parquet(
+    db: Session,
+    model,
+    criteria,
+    output_dir: str,
+    cutoff: datetime,
+    batch_size: int,
+) -> list[int]:
+    """Delete rows in batches and write the deleted rows to a zstd-compressed Parquet file.
+
+    Each DELETE re-checks `criteria`, so a row that changed since the
+    candidates were selected (say, an invoice no longer paid) stays put and
+    is not written. The file is written under a temporary name and only
+    renamed into place when the caller commits. Returns the archived ids.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet archival requires the 'pyarrow' package") from exc
+
+    source = model.__table__
+    names = [c.name for c in source.c]
+    schema = _arrow_schema(pa, source)
+    directory = os.path.join(output_dir, source.name)
+    path = os.path.join(
+        directory,
+        f"{source.name}_before_{cutoff:%Y_%m}_{datetime.utcnow():%Y%m%dT%H%M%S}.parquet",
+    )
+    temp_path = f"{path}.tmp"
+
+    candidate_ids = list(db.scalars(select(source.c.id).where(*criteria).order_by(source.c.id)))
+    archived_ids = []
+    writer = None
+    try:
+        for offset in range(0, len(candidate_ids), batch_size):
+            chunk = candidate_ids[offset:offset + batch_size]
+            # `criteria` bounds created_at, which also lets Postgres prune to the archived partitions.
+            rows = db.execute(delete(source).where(source.c.id.in_(chunk), *criteria).returning(*source.c)).all()
+            if not rows:
+                continue
+            columns = {name: [] for name in names}
+            for row in rows:
+                for name, value in zip(names, row):
+                    columns[name].append(value.value if isinstance(value, enum.Enum) else value)
+            batch = pa.table(columns, schema=schema)
+            if writer is None:
+                os.makedirs(directory, exist_ok=True)
+                writer = pq.ParquetWriter(temp_path, schema, compression="zstd")
+            writer.write_table(batch)
+            archived_ids.extend(columns["id"])
+    except Exception:
+        if writer is not None:
+            writer.close()
+            os.remove(temp_path)
+        raise
+    if writer is not None:
+        writer.close()
+        _publish_on_commit(db, temp_path, path)
+    return archived_ids
+
+
+def _check_no_new_invoices(db: Session, job_ids: list[int], batch_size: int) -> None:
+    """Fail the run if a live invoice was created for a job while it was being archived.
+
+    Invoice creation locks its job `FOR KEY SHARE` until it commits, so the
+    job's DELETE waited for it; its invoice is visible to this later
+    statement. Nothing enforces the foreign key on partitioned tables, so
+    archiving the job would leave the invoice orphaned.
+    """
+    for offset in range(0, len(job_ids), batch_size):
+        chunk = job_ids[offset:offset + batch_size]
+        if db.scalar(select(exists().where(Invoice.job_id.in_(chunk), Invoice.deleted_at.is_(None)))):
+            raise RuntimeError("An invoice was created for a job being archived; run the archive again")
+
+
+def archive_closed_rows(
+    db: Session,
+    older_than_months: int,
+    target: str = "parquet",
+    output_dir: str = "archive",
+    batch_size: int = 10000,
+) -> dict[str, int]:
+    """Archive paid invoices and closed jobs created more than N months ago.
+
+    Invoices are archived first so that the jobs they belonged to become
+    eligible in the same run. Everything happens in one transaction; the
+    caller commits, and Parquet files only appear once it has.
+    """
+    if target not in ARCHIVE_TARGETS:
+        raise ValueError(f"Unknown archive target {target!r}, expected one of {ARCHIVE_TARGETS}")
+
+    cutoff = archive_cutoff(older_than_months)
+    counts = {}
+    for model, criteria in (
+        (Invoice, _closed_invoices(cutoff)),
+        (Job, _closed_jobs(cutoff)),
+    ):
+        if target == "cold":
+            archived_ids = _move_to_cold(db, model, criteria)
+        else:
+            archived_ids = _move_to_parquet(db, model, criteria, output_dir, cutoff, batch_size)
+        if model is Job:
+            _check_no_new_invoices(db, archived_ids, batch_size)
+        counts[model.__tablename__] = len(archived_ids)
+    return counts
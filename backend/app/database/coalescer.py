@@ -0,0 +1,209 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+from sqlalchemy import bindparam, case, func, update
+from sqlalchemy.orm import Session
+from app.core.config import Settings
+from app.database.engine import new_session
+from app.database.repository import scope_to_tenant
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """Convert an aware timestamp to naive UTC, the form `datetime.utcnow()` returns."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class _PendingUpdate:
+    """Merged changes for one row waiting to be flushed, with when each field was changed."""
+    changes: dict[str, Any] = field(default_factory=dict)
+    changed_at: dict[str, datetime] = field(default_factory=dict)
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+    def merge(self, changes: dict[str, Any], updated_at: datetime) -> None:
+        """Merge an update made at `updated_at`; per field, the latest change wins."""
+        for name, value in changes.items():
+            if name not in self.changed_at or updated_at >= self.changed_at[name]:
+                self.changes[name] = value
+                self.changed_at[name] = updated_at
+
+
+class WriteCoalescer:
+    """Buffers small row updates and flushes them as one executemany per batch.
+
+    Updates submitted within `window_ms` of each other are merged per row and
+    written in a single transaction, scoped to the submitting tenant's
+    `account_id`, with one UPDATE statement per distinct set of changed
+    columns. Soft-deleted rows are left untouched. `submit` returns once
+    the transaction holding the update has committed.
+
+    Each field is written only if its change is not older than the row's
+    stored `updated_at`, which then becomes the latest applied change time,
+    so a stale update arriving in a later window does not overwrite newer
+    data. Times are on the server's clock: a client-supplied `updated_at`
+    may place a change in the past (an offline edit), never in the future.
+    """
+
+    def __init__(
+        self,
+        model,
+        serialize: Callable[[Any], Any],
+        window_ms: int,
+        max_batch: int,
+        session_factory: Callable[[], Session] = new_session,
+    ):
+        self.model = model
+        self.serialize = serialize
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.session_factory = session_factory
+        self._pending: dict[tuple[int, int], _PendingUpdate] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        tenant_id: int,
+        row_id: int,
+        changes: dict[str, Any],
+        updated_at: datetime | None = None,
+    ):
+        """Queue an update of a tenant's row and wait until it is durable.
+
+        Returns the serialized row after the flush, or None if the tenant has no such row.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        now = datetime.utcnow()
+        updated_at = min(_as_naive_utc(updated_at), now) if updated_at is not None else now
+
+        changes = {name: value for name, value in changes.items() if name != "account_id"}
+        key = (tenant_id, row_id)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingUpdate()
+        pending.merge(changes, updated_at)
+        pending.waiters.append(waiter)
+
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_flush)
+        return await waiter
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: dict[tuple[int, int], _PendingUpdate]) -> None:
+        try:
+            rows = await asyncio.to_thread(self._write, batch)
+            results = {key: rows.get(key) for key in batch}
+        except Exception as exc:
+            if len(batch) == 1:
+                results = {key: exc for key in batch}
+            else:
+                # Retry row by row so one bad update only fails its own callers.
+                results = await asyncio.to_thread(self._write_each, batch)
+
+        for key, pending in batch.items():
+            result = results[key]
+            for waiter in pending.waiters:
+                if waiter.done():
+                    continue
+                if isinstance(result, Exception):
+                    waiter.set_exception(result)
+                else:
+                    waiter.set_result(result)
+
+    def _write_each(self, batch: dict[tuple[int, int], _PendingUpdate]) -> dict[tuple[int, int], Any]:
+        """Apply each update in its own transaction, returning the row or the error per key."""
+        results = {}
+        for key, pending in batch.items():
+            try:
+                results[key] = self._write({key: pending}).get(key)
+            except Exception as exc:
+                results[key] = exc
+        return results
+
+    @staticmethod
+    def _guarded_values(table, columns: tuple[str, ...]) -> dict[str, Any]:
+        """SET clauses applying each field only if it changed no earlier than the stored row."""
+        changed_at = {name: bindparam(f"t_{name}", type_=table.c.updated_at.type) for name in columns}
+        values = {
+            name: case(
+                (table.c.updated_at <= changed_at[name], bindparam(f"v_{name}", type_=table.c[name].type)),
+                else_=table.c[name],
+            )
+            for name in columns
+        }
+        values["updated_at"] = func.greatest(table.c.updated_at, *changed_at.values())
+        return values
+
+    def _write(self, batch: dict[tuple[int, int], _PendingUpdate]) -> dict[tuple[int, int], Any]:
+        """Apply a batch in one transaction and return the serialized rows by (tenant, id)."""
+        table = self.model.__table__
+        tenants: dict[int, dict[tuple[str, ...], list[dict[str, Any]]]] = {}
+        for (tenant_id, row_id), pending in batch.items():
+            columns = tuple(sorted(pending.changes))
+            params = {f"v_{name}": value for name, value in pending.changes.items()}
+            params.update({f"t_{name}": changed_at for name, changed_at in pending.changed_at.items()})
+            params["b_id"] = row_id
+            params["b_account_id"] = tenant_id
+            tenants.setdefault(tenant_id, {}).setdefault(columns, []).append(params)
+
+        db = self.session_factory()
+        rows = {}
+        try:
+            for tenant_id, groups in tenants.items():
+                # Row-level security only shows the rows of the tenant in scope.
+                scope_to_tenant(db, tenant_id)
+                for columns, params in groups.items():
+                    if not columns:
+                        continue
+                    statement = (
+                        update(table)
+                        .where(
+                            table.c.id == bindparam("b_id"),
+                            table.c.account_id == bindparam("b_account_id"),
+                            table.c.deleted_at.is_(None),
+                        )
+                        .values(self._guarded_values(table, columns))
+                    )
+                    db.execute(statement, params)
+
+                found = db.query(self.model).filter(
+                    self.model.account_id == tenant_id,
+                    self.model.id.in_([row_id for row_tenant, row_id in batch if row_tenant == tenant_id]),
+                    self.model.deleted_at.is_(None),
+                )
+                rows.update({(row.account_id, row.id): self.serialize(row) for row in found})
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return rows
+
+
+def create_job_coalescer(settings: Settings) -> WriteCoalescer:
+    """Build the coalescer for job updates."""
+    from app.models.job import Job as JobModel
+    from app.schemas.job import Job
+
+    return WriteCoalescer(
+        JobModel,
+        serialize=Job.model_validate,
+        window_ms=settings.job_write_coalesce_window_ms,
+        max_batch=settings.job_write_coalesce_max_batch,
+    )
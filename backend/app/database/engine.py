@@ -1,24 +1,66 @@
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from app.core.config import get_settings
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from app.core.config import Settings, get_settings
 
-settings = get_settings()
+# Bound to the engine by init_engine(), usually from the application lifespan.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
-engine = create_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-)
+Base = declarative_base()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_engine: Engine | None = None
+_settings: Settings | None = None
 
-Base = declarative_base()
+
+def configure_engine(settings: Settings) -> None:
+    """Use `settings` when the engine is created, instead of the environment."""
+    global _settings
+    _settings = settings
+
+
+def init_engine(settings: Settings) -> Engine:
+    """Create the process-wide engine from settings, if not created yet.
+
+    Only PostgreSQL is supported: change tracking, row-level security and
+    partitioning rely on it.
+    """
+    global _engine
+    if _engine is None:
+        backend = make_url(settings.database_url).get_backend_name()
+        if backend != "postgresql":
+            raise ValueError(f"DATABASE_URL must be a PostgreSQL URL, not {backend}")
+        _engine = create_engine(
+            settings.database_url,
+            echo=settings.database_echo,
+            # now() defaults then agree with the naive UTC timestamps set by the application.
+            connect_args={"options": "-c timezone=UTC"},
+        )
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def get_engine() -> Engine:
+    """Get the engine, creating it on first use from the configured (or environment) settings."""
+    return _engine if _engine is not None else init_engine(_settings or get_settings())
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections and forget the engine."""
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+
+
+def new_session() -> Session:
+    """Open a session bound to the engine."""
+    get_engine()
+    return SessionLocal()
 
 
 def get_db():
     """Dependency for getting database session."""
-    db = SessionLocal()
+    db = new_session()
     try:
         yield db
     finally:
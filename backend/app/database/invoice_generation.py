@@ -0,0 +1,123 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import select, update, insert, exists
+from sqlalchemy.orm import Session
+from app.database.repository import TenantRepository
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.invoice_sequence import InvoiceNumberSequence
+from app.models.job import Job, JobStatus
+
+INVOICE_SEQUENCE = "invoice"
+CENTS = Decimal("0.01")
+
+
+@dataclass
+class GeneratedInvoices:
+    """Outcome of an invoice generation run."""
+    created: int
+    first_invoice_number: str | None = None
+    last_invoice_number: str | None = None
+
+
+def compute_totals(amount: Decimal, tax_rate: Decimal) -> tuple[Decimal, Decimal, Decimal]:
+    """Return (amount, tax_amount, total_amount) rounded to cents."""
+    amount = amount.quantize(CENTS, rounding=ROUND_HALF_UP)
+    tax_amount = (amount * tax_rate).quantize(CENTS, rounding=ROUND_HALF_UP)
+    return amount, tax_amount, amount + tax_amount
+
+
+def _lock_sequence(db: Session) -> int:
+    """Lock the invoice number counter for this transaction and return its next value."""
+    next_value = db.execute(
+        select(InvoiceNumberSequence.next_value)
+        .where(InvoiceNumberSequence.name == INVOICE_SEQUENCE)
+        .with_for_update()
+    ).scalar_one_or_none()
+    if next_value is None:
+        db.execute(insert(InvoiceNumberSequence).values(name=INVOICE_SEQUENCE, next_value=1))
+        next_value = 1
+    return next_value
+
+
+def generate_invoices(
+    db: Session,
+    tenant_id: int,
+    amount: Decimal | None,
+    tax_rate: Decimal,
+    job_amounts: Mapping[int, Decimal] | None = None,
+    completed_from: datetime | None = None,
+    completed_to: datetime | None = None,
+    due_in_days: int | None = None,
+    number_prefix: str = "INV-",
+    chunk_size: int = 5000,
+) -> GeneratedInvoices:
+    """Create draft invoices for a tenant's completed jobs that have none yet.
+
+    Each job is billed its entry in `job_amounts`, or `amount` when it has
+    none; with no `amount`, only jobs listed in `job_amounts` are invoiced.
+
+    The invoice number counter row is locked once for the whole run rather
+    than per invoice. That serializes concurrent runs, so no job is
+    invoiced twice. Numbers are allocated in the same transaction as the
+    inserts, so a failed run rolls the counter back and leaves no gaps.
+    Invoices are inserted in `chunk_size` executemany batches; the caller
+    commits.
+    """
+    jobs = TenantRepository(db, Job, tenant_id).query().with_entities(Job.id).filter(
+        Job.status == JobStatus.COMPLETED,
+        # Deleted invoices are tombstones; their jobs can be invoiced again.
+        ~exists().where(Invoice.job_id == Job.id, Invoice.deleted_at.is_(None)),
+    )
+    job_amounts = job_amounts or {}
+    if amount is None:
+        jobs = jobs.filter(Job.id.in_(list(job_amounts)))
+    if completed_from is not None:
+        jobs = jobs.filter(Job.completed_date >= completed_from)
+    if completed_to is not None:
+        jobs = jobs.filter(Job.completed_date < completed_to)
+
+    first_value = _lock_sequence(db)
+    # Key-share locks keep archival from removing the jobs before their invoices commit.
+    job_ids = [job_id for (job_id,) in jobs.order_by(Job.id).with_for_update(read=True, key_share=True)]
+    if not job_ids:
+        return GeneratedInvoices(created=0)
+
+    # Totals only depend on the amount, so compute them once per distinct amount.
+    totals = {
+        price: compute_totals(price, tax_rate)
+        for price in {job_amounts.get(job_id, amount) for job_id in job_ids}
+    }
+    due_date = datetime.utcnow() + timedelta(days=due_in_days) if due_in_days is not None else None
+
+    def invoice_number(value: int) -> str:
+        return f"{number_prefix}{value:08d}"
+
+    for offset in range(0, len(job_ids), chunk_size):
+        chunk = job_ids[offset:offset + chunk_size]
+        rows = []
+        for index, job_id in enumerate(chunk):
+            job_amount, tax_amount, total_amount = totals[job_amounts.get(job_id, amount)]
+            rows.append({
+                "account_id": tenant_id,
+                "job_id": job_id,
+                "invoice_number": invoice_number(first_value + offset + index),
+                "amount": job_amount,
+                "tax_amount": tax_amount,
+                "total_amount": total_amount,
+                "status": InvoiceStatus.DRAFT,
+                "due_date": due_date,
+            })
+        db.execute(insert(Invoice), rows)
+
+    db.execute(
+        update(InvoiceNumberSequence)
+        .where(InvoiceNumberSequence.name == INVOICE_SEQUENCE)
+        .values(next_value=first_value + len(job_ids))
+    )
+    return GeneratedInvoices(
+        created=len(job_ids),
+        first_invoice_number=invoice_number(first_value),
+        last_invoice_number=invoice_number(first_value + len(job_ids) - 1),
+    )
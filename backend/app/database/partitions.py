@@ -0,0 +1,69 @@
+from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Tables partitioned by RANGE (created_at), one partition per calendar month.
+PARTITIONED_TABLES = ("jobs", "invoices")
+
+
+def month_start(value: datetime) -> datetime:
+    """Truncate a datetime to the first instant of its month."""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shift a month-aligned datetime by a number of months."""
+    month_index = value.year * 12 + (value.month - 1) + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Name of the monthly partition of `table` holding `month`."""
+    return f"{table}_p{month:%Y_%m}"
+
+
+def hot_partition_cutoff(hot_months: int, now: datetime | None = None) -> datetime:
+    """Lower `created_at` bound of the hot partitions.
+
+    The bound is month-aligned so that Postgres prunes whole partitions
+    instead of scanning the oldest hot partition partially.
+    """
+    current = month_start(now or datetime.utcnow())
+    return add_months(current, -(max(hot_months, 1) - 1))
+
+
+def create_monthly_partitions(
+    connection: Connection,
+    table: str,
+    start: datetime,
+    months: int,
+) -> list[str]:
+    """Create `months` monthly partitions of `table` starting at `start`.
+
+    Existing partitions are left untouched, so this is safe to run on a
+    schedule ahead of the months it covers.
+    """
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"Table {table!r} is not range partitioned")
+
+    created = []
+    month = month_start(start)
+    for _ in range(months):
+        upper = add_months(month, 1)
+        name = partition_name(table, month)
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        ))
+        created.append(name)
+        month = upper
+    return created
+
+
+def ensure_future_partitions(connection: Connection, months_ahead: int) -> list[str]:
+    """Create partitions for the current month and `months_ahead` months after it."""
+    start = month_start(datetime.utcnow())
+    created = []
+    for table in PARTITIONED_TABLES:
+        created.extend(create_monthly_partitions(connection, table, start, months_ahead + 1))
+    return created
@@ -0,0 +1,264 @@
+import logging
+import pickle
+import select
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Callable, TypeVar
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, ORMExecuteState
+from sqlalchemy.sql import Executable
+from sqlalchemy.sql.util import find_tables
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Session.info key collecting the tables written by the current transaction.
+CHANGED_TABLES_INFO_KEY = "changed_tables"
+
+# Postgres channel notified with the table name after each write (migration 008).
+TABLE_CHANGES_CHANNEL = "table_changes"
+
+
+class TableVersions:
+    """Per-table version counters, bumped whenever a write to the table commits.
+
+    `synced` is false while writes made by other processes may be going
+    unseen, in which case cached results must not be trusted.
+    """
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.synced = True
+
+    def snapshot(self, tables: frozenset[str]) -> tuple:
+        """Current versions of `tables`, in a comparable form."""
+        with self._lock:
+            return (self._epoch, tuple(sorted((table, self._versions.get(table, 0)) for table in tables)))
+
+    def bump(self, tables: set[str]) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def bump_all(self) -> None:
+        """Invalidate every table, e.g. after notifications may have been missed."""
+        with self._lock:
+            self._epoch += 1
+
+
+table_versions = TableVersions()
+
+
+class TableChangeListener(threading.Thread):
+    """Applies table change notifications from every process to `versions`.
+
+    Postgres notifies `table_changes` after each committed write to a cached
+    table, whichever process made it. While the listener is disconnected,
+    `versions.synced` is false so the cache is bypassed, and every version
+    is bumped on reconnect, since notifications may have been missed.
+    """
+
+    def __init__(self, engine: Engine, versions: "TableVersions", poll_interval: float = 1.0):
+        super().__init__(name="table-change-listener", daemon=True)
+        self.engine = engine
+        self.versions = versions
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+        versions.synced = False
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Table change listener disconnected")
+            self.versions.synced = False
+            self._stopped.wait(self.poll_interval)
+
+    def _listen(self) -> None:
+        # A connection of its own, outside the pool, kept in autocommit for LISTEN.
+        pooled = self.engine.raw_connection()
+        pooled.detach()
+        connection = pooled.driver_connection
+        try:
+            connection.autocommit = True
+            connection.cursor().execute(f"LISTEN {TABLE_CHANGES_CHANNEL}")
+            self.versions.bump_all()
+            self.versions.synced = True
+            while not self._stopped.is_set():
+                if select.select([connection], [], [], self.poll_interval)[0]:
+                    connection.poll()
+                    changed = {notify.payload for notify in connection.notifies}
+                    connection.notifies.clear()
+                    self.versions.bump(changed)
+        finally:
+            pooled.close()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    versions: tuple
+    size: int
+    stored_at: float
+
+
+class QueryResultCache:
+    """Caches computed query results, keyed by normalized SQL and parameters.
+
+    An entry stays valid as long as none of the tables its statement reads
+    from has had a write committed since it was computed, and for at most
+    `ttl` seconds as a backstop. Writes by this process are seen at commit;
+    on Postgres, writes by other processes arrive through a
+    `TableChangeListener`. Entries are evicted least recently used first
+    once their pickled size exceeds `max_bytes`. Concurrent misses on the
+    same key are collapsed: one caller computes, the others wait for its
+    result.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, versions: TableVersions = table_versions):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.versions = versions
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._in_flight: dict[tuple, threading.Event] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def statement_key(statement: Executable) -> tuple[tuple, frozenset[str]]:
+        """Cache key and source tables for a statement."""
+        compiled = statement.compile()
+        sql = " ".join(str(compiled).split())
+        params = tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in compiled.params.items()
+        ))
+        tables = frozenset(table.name for table in find_tables(statement, include_crud=True))
+        return (sql, params), tables
+
+    def get_or_compute(self, statement: Executable, compute: Callable[[], T]) -> T:
+        """Return the cached result of `statement`, running `compute` on a miss."""
+        if not self.versions.synced:
+            return compute()
+        key, tables = self.statement_key(statement)
+        while True:
+            versions = self.versions.snapshot(tables)
+            with self._lock:
+                entry = self._entries.get(key)
+                if (
+                    entry is not None
+                    and entry.versions == versions
+                    and time.monotonic() - entry.stored_at < self.ttl
+                ):
+                    self._entries.move_to_end(key)
+                    return entry.value
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    in_flight = self._in_flight[key] = threading.Event()
+                    break
+            # Another caller is computing this key; wait for it and look again.
+            in_flight.wait()
+
+        try:
+            # Versions were read before computing, so a write committed
+            # meanwhile leaves this entry already stale.
+            stored_at = time.monotonic()
+            value = compute()
+            size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            self._store(key, _CacheEntry(value, versions, size, stored_at))
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.set()
+
+    def _store(self, key: tuple, entry: _CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class _DisabledQueryCache:
+    """Stand-in used when the cache is disabled; always computes."""
+
+    def get_or_compute(self, statement: Executable, compute: Callable[[], T]) -> T:
+        return compute()
+
+
+def create_query_cache(settings: Settings) -> QueryResultCache | _DisabledQueryCache:
+    """Build the query result cache, or a stand-in when it is disabled."""
+    if not settings.query_cache_enabled:
+        return _DisabledQueryCache()
+    return QueryResultCache(settings.query_cache_max_bytes, settings.query_cache_ttl_seconds)
+
+
+def start_table_change_listener(engine: Engine) -> TableChangeListener | None:
+    """Listen for other processes' writes; only Postgres can notify them."""
+    if engine.dialect.name != "postgresql":
+        return None
+    listener = TableChangeListener(engine, table_versions)
+    listener.start()
+    return listener
+
+
+def get_query_cache(request: Request) -> QueryResultCache | _DisabledQueryCache:
+    """Dependency for the application's query result cache."""
+    return request.app.state.query_cache
+
+
+def _changed_tables(session: Session) -> set[str]:
+    return session.info.setdefault(CHANGED_TABLES_INFO_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session: Session, flush_context) -> None:
+    changed = _changed_tables(session)
+    for instance in chain(session.new, session.dirty, session.deleted):
+        changed.update(table.name for table in instance.__mapper__.tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_executed_tables(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _changed_tables(state.session).update(
+            table.name for table in find_tables(state.statement, include_crud=True)
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session: Session) -> None:
+    changed = session.info.pop(CHANGED_TABLES_INFO_KEY, None)
+    if changed:
+        table_versions.bump(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session: Session) -> None:
+    session.info.pop(CHANGED_TABLES_INFO_KEY, None)
@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query, Session
+
+ModelT = TypeVar("ModelT")
+
+# Session.info key holding the tenant a session is scoped to.
+TENANT_INFO_KEY = "tenant_id"
+
+
+class TenantRepository(Generic[ModelT]):
+    """Data access for a model, always scoped to a single account.
+
+    Every query built here filters on `account_id`, so lookups use the
+    `ix_<table>_account_id` indexes and rows of other accounts are never
+    visible, whatever filters callers add on top. Deleted rows are kept as
+    tombstones for sync clients and hidden from queries by default.
+    """
+
+    def __init__(self, db: Session, model: type[ModelT], tenant_id: int):
+        self.db = db
+        self.model = model
+        self.tenant_id = tenant_id
+        scope_to_tenant(db, tenant_id)
+
+    def query(self, include_deleted: bool = False) -> Query:
+        """Query rows belonging to the tenant, optionally including tombstones."""
+        query = self.db.query(self.model).filter(self.model.account_id == self.tenant_id)
+        if not include_deleted:
+            query = query.filter(self.model.deleted_at.is_(None))
+        return query
+
+    def get(self, row_id: int, key_share: bool = False) -> ModelT | None:
+        """Get a tenant's row by ID.
+
+        With `key_share`, the row is locked `FOR KEY SHARE` until the
+        transaction ends, so it cannot be deleted (e.g. archived) meanwhile.
+        """
+        query = self.query().filter(self.model.id == row_id)
+        if key_share:
+            query = query.with_for_update(read=True, key_share=True)
+        return query.first()
+
+    def create(self, data: dict[str, Any]) -> ModelT:
+        """Create a row owned by the tenant, whatever `account_id` was supplied."""
+        row = self.model(**{**data, "account_id": self.tenant_id})
+        self.db.add(row)
+        self.db.commit()
+        self.db.refresh(row)
+        return row
+
+    def update(self, row: ModelT, data: dict[str, Any]) -> ModelT:
+        """Apply changes to a tenant's row."""
+        data.pop("account_id", None)
+        for field, value in data.items():
+            setattr(row, field, value)
+        self.db.add(row)
+        self.db.commit()
+        self.db.refresh(row)
+        return row
+
+    def delete(self, row: ModelT) -> None:
+        """Soft-delete a tenant's row, leaving a tombstone for sync clients."""
+        row.deleted_at = datetime.utcnow()
+        self.db.add(row)
+        self.db.commit()
+
+
+def _set_rls_tenant(connection: Connection, tenant_id: int) -> None:
+    if connection.dialect.name == "postgresql":
+        # Transaction-local, so nothing leaks to the next user of the pooled connection.
+        connection.execute(
+            text("SELECT set_config('app.tenant', :tenant, true)"),
+            {"tenant": str(tenant_id)},
+        )
+
+
+def scope_to_tenant(db: Session, tenant_id: int) -> None:
+    """Scope a session's current and later transactions to a tenant.
+
+    On PostgreSQL this sets `app.tenant`, which the row-level security
+    policies require: transactions without it see no tenant rows at all.
+    """
+    db.info[TENANT_INFO_KEY] = tenant_id
+    if db.in_transaction():
+        _set_rls_tenant(db.connection(), tenant_id)
+
+
+@event.listens_for(Session, "after_begin")
+def _scope_new_transaction(session: Session, transaction, connection) -> None:
+    """Expose the session's tenant to Postgres row-level security policies."""
+    tenant_id = session.info.get(TENANT_INFO_KEY)
+    if tenant_id is not None:
+        _set_rls_tenant(connection, tenant_id)
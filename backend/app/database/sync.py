@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from sqlalchemy import BigInteger, literal, text, tuple_
+from sqlalchemy.orm import Session
+from app.database.repository import TenantRepository
+from app.models.account import Account
+from app.models.invoice import Invoice
+from app.models.job import Job
+from app.models.technician import Technician
+
+# Tenant-owned models returned by a sync, besides the account itself.
+SYNCED_MODELS = (Technician, Job, Invoice)
+
+
+# A change token is "<change_xid>.<change_seq>" of the last row handed out; "0" starts over.
+TOKEN_PATTERN = r"^\d+(\.\d+)?$"
+
+
+def _parse_token(token: str) -> tuple[int, int]:
+    change_xid, _, change_seq = token.partition(".")
+    return int(change_xid), int(change_seq or 0)
+
+
+def _format_token(change_xid: int, change_seq: int) -> str:
+    return f"{change_xid}.{change_seq}"
+
+
+@dataclass
+class SyncPage:
+    """Rows changed after a change token, keyed by table name."""
+    rows: dict[str, list] = field(default_factory=dict)
+    next_token: str = "0"
+    has_more: bool = False
+
+
+def changes_since(db: Session, tenant_id: int, since: str, limit: int) -> SyncPage:
+    """Return up to `limit` of a tenant's rows changed or deleted after `since`.
+
+    Changes are ordered by `(change_xid, change_seq)`: by writing
+    transaction, then by the shared sequence within it. Only rows whose
+    transaction is older than the oldest transaction still running are
+    returned. Those transactions have all finished, and any transaction
+    that commits later has a higher id, so it sorts after the returned
+    token and is picked up by a later sync however long it ran. The page
+    holds the `limit` lowest changes across all tables, and the last of
+    them is the token for the next page. Each table is read through its
+    `(account_id, change_xid, change_seq)` index, so the cost grows with
+    the number of changes rather than the size of the table.
+    """
+    since_xid, since_seq = _parse_token(since)
+    # Every transaction below this id has committed or rolled back.
+    settled_xid = db.scalar(text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint"))
+
+    def changed_after(query, model):
+        return query.filter(
+            tuple_(model.change_xid, model.change_seq)
+            > tuple_(literal(since_xid, BigInteger), literal(since_seq, BigInteger)),
+            model.change_xid < settled_xid,
+        ).order_by(model.change_xid, model.change_seq)
+
+    changed = changed_after(db.query(Account).filter(Account.id == tenant_id), Account).all()
+    for model in SYNCED_MODELS:
+        query = TenantRepository(db, model, tenant_id).query(include_deleted=True)
+        changed.extend(changed_after(query, model).limit(limit + 1))
+    changed.sort(key=lambda row: (row.change_xid, row.change_seq))
+
+    page = SyncPage(next_token=since, has_more=len(changed) > limit)
+    page.rows = {model.__tablename__: [] for model in (Account, *SYNCED_MODELS)}
+    for row in changed[:limit]:
+        page.rows[row.__tablename__].append(row)
+        page.next_token = _format_token(row.change_xid, row.change_seq)
+    return page
@@ -1,38 +1,102 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import get_settings
-from app.api import health, accounts
-
-settings = get_settings()
-
-app = FastAPI(
-    title=settings.app_name,
-    description="Backend service for field solutions management",
-    version="0.1.0",
-    docs_url="/api/docs",
-    openapi_url="/api/openapi.json",
-)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(health.router)
-app.include_router(accounts.router, prefix="/api")
-
-
-@app.get("/")
-def read_root():
-    """Root endpoint."""
-    return {
-        "app_name": settings.app_name,
-        "version": "0.1.0",
-        "docs_url": "/api/docs",
-        "openapi_url": "/api/openapi.json"
-    }
+from app.core.config import Settings, get_settings
+from app.database.engine import configure_engine, init_engine, dispose_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the database engine and start background checkers on startup; release them on shutdown."""
+    settings = app.state.settings
+    engine = init_engine(settings)
+    listener = None
+    if settings.query_cache_enabled:
+        from app.database.query_cache import start_table_change_listener
+        listener = start_table_change_listener(engine)
+    app.state.readiness_checker.start()
+    yield
+    await app.state.readiness_checker.stop()
+    if listener is not None:
+        listener.stop()
+    dispose_engine()
+
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    """Build the FastAPI application.
+
+    Routers (and the schemas and dependencies they pull in) are imported
+    here rather than at module import, so tools that only need models or
+    settings, like Alembic, never load them.
+    """
+    from app.api import health, accounts, jobs, invoices, sync
+    from app.core.readiness import ReadinessChecker
+    from app.database.coalescer import create_job_coalescer
+    from app.database.query_cache import create_query_cache
+
+    settings = settings or get_settings()
+
+    app = FastAPI(
+        title=settings.app_name,
+        description="Backend service for field solutions management",
+        version="0.1.0",
+        docs_url="/api/docs",
+        openapi_url="/api/openapi.json",
+        lifespan=lifespan,
+    )
+    app.state.settings = settings
+    app.state.readiness_checker = ReadinessChecker.from_settings(settings)
+    app.state.job_coalescer = create_job_coalescer(settings)
+    app.state.query_cache = create_query_cache(settings)
+    configure_engine(settings)
+    app.dependency_overrides[get_settings] = lambda: settings
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Compress large responses with brotli (when installed) or gzip
+    if settings.response_compression_enabled:
+        from app.core.compression import CompressionMiddleware
+        app.add_middleware(CompressionMiddleware, minimum_size=settings.response_compression_minimum_size)
+
+    # Profile sampled requests only when enabled, so it adds no overhead otherwise
+    if settings.profiling_enabled:
+        from app.core.profiling import ProfileStore, ProfilingMiddleware
+        app.state.profile_store = ProfileStore(settings.profiling_max_profiles)
+        app.add_middleware(ProfilingMiddleware, settings=settings, store=app.state.profile_store)
+
+    # Include routers
+    app.include_router(health.router)
+    app.include_router(accounts.router, prefix="/api")
+    app.include_router(jobs.router, prefix="/api")
+    app.include_router(invoices.router, prefix="/api")
+    app.include_router(sync.router, prefix="/api")
+    if settings.profiling_enabled:
+        from app.api import profiling
+        app.include_router(profiling.router, prefix="/api")
+
+    @app.get("/")
+    def read_root():
+        """Root endpoint."""
+        return {
+            "app_name": settings.app_name,
+            "version": "0.1.0",
+            "docs_url": "/api/docs",
+            "openapi_url": "/api/openapi.json"
+        }
+
+    return app
+
+
+def __getattr__(name: str):
+    # Keeps `uvicorn app.main:app` working; prefer `uvicorn --factory app.main:create_app`.
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
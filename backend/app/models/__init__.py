@@ -2,5 +2,6 @@ from app.models.account import Account
 from app.models.technician import Technician
 from app.models.job import Job
 from app.models.invoice import Invoice
+from app.models.invoice_sequence import InvoiceNumberSequence
 
-__all__ = ["Account", "Technician", "Job", "Invoice"]
+__all__ = ["Account", "Technician", "Job", "Invoice", "InvoiceNumberSequence"]
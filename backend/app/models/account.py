@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Boolean
 from sqlalchemy.sql import func
 from app.database.engine import Base
+from app.models.change_sequence import CHANGE_SEQUENCE, CHANGE_XID_DEFAULT, CHANGE_XID_ONUPDATE
 
 
 class Account(Base):
@@ -19,3 +20,11 @@ class Account(Base):
     is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    change_seq = Column(
+        BigInteger,
+        server_default=CHANGE_SEQUENCE.next_value(),
+        onupdate=CHANGE_SEQUENCE.next_value(),
+        nullable=False,
+    )
+    change_xid = Column(BigInteger, server_default=CHANGE_XID_DEFAULT, onupdate=CHANGE_XID_ONUPDATE, nullable=False)
@@ -0,0 +1,13 @@
+from sqlalchemy import Sequence, literal_column, text
+from app.database.engine import Base
+
+# One sequence shared by every synced table, so a single change token orders
+# writes across all of them. Each insert or update draws the next value.
+CHANGE_SEQUENCE = Sequence("change_seq", metadata=Base.metadata)
+
+# Id of the transaction writing a row, stored alongside `change_seq`. A sync
+# only hands out rows of transactions older than every running one, so a
+# change is never skipped because its transaction committed late.
+CURRENT_XACT_ID = "pg_current_xact_id()::text::bigint"
+CHANGE_XID_DEFAULT = text(CURRENT_XACT_ID)
+CHANGE_XID_ONUPDATE = literal_column(CURRENT_XACT_ID)
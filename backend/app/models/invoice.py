@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Numeric, Text, Enum as SQLEnum
+from sqlalchemy import BigInteger, Column, Index, Integer, String, DateTime, Boolean, ForeignKey, Numeric, Text, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.sql import func
 from app.database.engine import Base
+from app.models.change_sequence import CHANGE_SEQUENCE, CHANGE_XID_DEFAULT, CHANGE_XID_ONUPDATE
 import enum
 
 
@@ -17,19 +18,40 @@ class Invoice(Base):
     """Invoice model for storing job invoices."""
     
     __tablename__ = "invoices"
+    __table_args__ = (
+        Index("ix_invoices_account_id_change_xid", "account_id", "change_xid", "change_seq"),
+        # Partitioned tables can only enforce uniqueness with the partition key;
+        # the invoice_numbers table keeps numbers globally unique (migration 006).
+        UniqueConstraint("invoice_number", "created_at", name="invoices_invoice_number_key"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # On PostgreSQL the primary key is (id, created_at), since invoices are
+    # partitioned by month of created_at (migration 002); ids stay unique.
+    id = Column(Integer, primary_key=True, autoincrement=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
-    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
-    invoice_number = Column(String(50), unique=True, nullable=False, index=True)
+    # No foreign key: it could not reference the partitioned jobs(id) alone.
+    job_id = Column(Integer, nullable=False, index=True)
+    invoice_number = Column(String(50), nullable=False, index=True)
     description = Column(Text, nullable=True)
     amount = Column(Numeric(12, 2), nullable=False)
     tax_amount = Column(Numeric(12, 2), default=0)
     total_amount = Column(Numeric(12, 2), nullable=False)
-    status = Column(SQLEnum(InvoiceStatus), default=InvoiceStatus.DRAFT, index=True)
+    status = Column(
+        SQLEnum(InvoiceStatus, native_enum=False, length=50, values_callable=lambda statuses: [s.value for s in statuses]),
+        default=InvoiceStatus.DRAFT,
+        index=True,
+    )
     issued_date = Column(DateTime, server_default=func.now(), nullable=False)
     due_date = Column(DateTime, nullable=True)
     paid_date = Column(DateTime, nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    created_at = Column(DateTime, primary_key=True, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    change_seq = Column(
+        BigInteger,
+        server_default=CHANGE_SEQUENCE.next_value(),
+        onupdate=CHANGE_SEQUENCE.next_value(),
+        nullable=False,
+    )
+    change_xid = Column(BigInteger, server_default=CHANGE_XID_DEFAULT, onupdate=CHANGE_XID_ONUPDATE, nullable=False)
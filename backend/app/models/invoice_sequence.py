@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, BigInteger
+from app.database.engine import Base
+
+
+class InvoiceNumberSequence(Base):
+    """Gap-free counter used to allocate generated invoice numbers."""
+    
+    __tablename__ = "invoice_number_sequences"
+    
+    name = Column(String(50), primary_key=True)
+    next_value = Column(BigInteger, nullable=False, default=1)
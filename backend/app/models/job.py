@@ -1,6 +1,10 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import (
+    BigInteger, Column, Index, Integer, String, DateTime, Boolean, ForeignKey, ForeignKeyConstraint, Text,
+    Enum as SQLEnum,
+)
 from sqlalchemy.sql import func
 from app.database.engine import Base
+from app.models.change_sequence import CHANGE_SEQUENCE, CHANGE_XID_DEFAULT, CHANGE_XID_ONUPDATE
 import enum
 
 
@@ -16,18 +20,41 @@ class Job(Base):
     """Job model for storing service jobs."""
     
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_account_id_change_xid", "account_id", "change_xid", "change_seq"),
+        # A job's technician must belong to the job's account (migration 011).
+        ForeignKeyConstraint(
+            ["account_id", "technician_id"],
+            ["technicians.account_id", "technicians.id"],
+            name="jobs_account_id_technician_id_fkey",
+        ),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # On PostgreSQL the primary key is (id, created_at), since jobs are
+    # partitioned by month of created_at (migration 002); ids stay unique.
+    id = Column(Integer, primary_key=True, autoincrement=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
-    technician_id = Column(Integer, ForeignKey("technicians.id"), nullable=True)
+    technician_id = Column(Integer, nullable=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     address = Column(String(500), nullable=False)
     city = Column(String(100), nullable=False)
     state = Column(String(100), nullable=False)
     zip_code = Column(String(20), nullable=False)
-    status = Column(SQLEnum(JobStatus), default=JobStatus.PENDING, index=True)
+    status = Column(
+        SQLEnum(JobStatus, native_enum=False, length=50, values_callable=lambda statuses: [s.value for s in statuses]),
+        default=JobStatus.PENDING,
+        index=True,
+    )
     scheduled_date = Column(DateTime, nullable=True)
     completed_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    created_at = Column(DateTime, primary_key=True, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    change_seq = Column(
+        BigInteger,
+        server_default=CHANGE_SEQUENCE.next_value(),
+        onupdate=CHANGE_SEQUENCE.next_value(),
+        nullable=False,
+    )
+    change_xid = Column(BigInteger, server_default=CHANGE_XID_DEFAULT, onupdate=CHANGE_XID_ONUPDATE, nullable=False)
@@ -1,12 +1,18 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import BigInteger, Column, Index, Integer, String, DateTime, Boolean, ForeignKey, UniqueConstraint
 from sqlalchemy.sql import func
 from app.database.engine import Base
+from app.models.change_sequence import CHANGE_SEQUENCE, CHANGE_XID_DEFAULT, CHANGE_XID_ONUPDATE
 
 
 class Technician(Base):
     """Technician model for storing technician information."""
     
     __tablename__ = "technicians"
+    __table_args__ = (
+        Index("ix_technicians_account_id_change_xid", "account_id", "change_xid", "change_seq"),
+        # Target of the jobs' (account_id, technician_id) foreign key.
+        UniqueConstraint("account_id", "id", name="technicians_account_id_id_key"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
@@ -19,3 +25,11 @@ class Technician(Base):
     is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    change_seq = Column(
+        BigInteger,
+        server_default=CHANGE_SEQUENCE.next_value(),
+        onupdate=CHANGE_SEQUENCE.next_value(),
+        nullable=False,
+    )
+    change_xid = Column(BigInteger, server_default=CHANGE_XID_DEFAULT, onupdate=CHANGE_XID_ONUPDATE, nullable=False)
@@ -1,13 +1,33 @@
-from app.schemas.account import AccountCreate, AccountUpdate, Account
-from app.schemas.technician import TechnicianCreate, TechnicianUpdate, Technician
-from app.schemas.job import JobCreate, JobUpdate, Job, JobStatus
-from app.schemas.invoice import InvoiceCreate, InvoiceUpdate, Invoice, InvoiceStatus
-from app.schemas.health import HealthResponse, ReadinessResponse
-
-__all__ = [
-    "AccountCreate", "AccountUpdate", "Account",
-    "TechnicianCreate", "TechnicianUpdate", "Technician",
-    "JobCreate", "JobUpdate", "Job", "JobStatus",
-    "InvoiceCreate", "InvoiceUpdate", "Invoice", "InvoiceStatus",
-    "HealthResponse", "ReadinessResponse",
-]
+from importlib import import_module
+
+# Schemas are imported on first access, so importing one schema module (or
+# this package) does not pay for building every Pydantic model and loading
+# email_validator.
+_SCHEMA_MODULES = {
+    "app.schemas.account": ["AccountCreate", "AccountUpdate", "Account"],
+    "app.schemas.technician": ["TechnicianCreate", "TechnicianUpdate", "Technician"],
+    "app.schemas.job": [
+        "JobCreate", "JobUpdate", "Job", "JobStatus",
+        "JobBatchUpdateItem", "JobBatchUpdate", "JobBatchUpdateResult",
+    ],
+    "app.schemas.invoice": [
+        "InvoiceCreate", "InvoiceUpdate", "Invoice", "InvoiceStatus",
+        "InvoiceGenerateRequest", "InvoiceGenerateResult",
+    ],
+    "app.schemas.health": ["HealthResponse", "DependencyCheck", "ReadinessResponse"],
+    "app.schemas.profiling": ["ProfileSummary"],
+    "app.schemas.sync": ["SyncChanges"],
+}
+
+_SCHEMA_LOCATIONS = {name: module for module, names in _SCHEMA_MODULES.items() for name in names}
+
+__all__ = list(_SCHEMA_LOCATIONS)
+
+
+def __getattr__(name: str):
+    module = _SCHEMA_LOCATIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
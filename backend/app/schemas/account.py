@@ -36,6 +36,7 @@ class Account(AccountBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    deleted_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from datetime import datetime
 from typing import Optional
 
 
@@ -9,8 +10,19 @@ class HealthResponse(BaseModel):
     version: str = "0.1.0"
 
 
+class DependencyCheck(BaseModel):
+    """Result of the latest probe of one dependency."""
+    name: str
+    status: str
+    critical: bool
+    latency_ms: float
+    error: Optional[str] = None
+
+
 class ReadinessResponse(BaseModel):
     """Readiness check response schema."""
     status: str
     database: str
     app_name: str
+    checked_at: Optional[datetime] = None
+    checks: list[DependencyCheck] = []
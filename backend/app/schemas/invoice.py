@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 from decimal import Decimal
 from enum import Enum
 
@@ -52,6 +52,34 @@ class Invoice(InvoiceBase):
     paid_date: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+    deleted_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
+
+
+class InvoiceGenerateRequest(BaseModel):
+    """Schema for generating invoices for completed jobs without one.
+
+    Each job is billed its entry in `job_amounts`, or `amount` when it has
+    none. Without `amount`, only the jobs listed in `job_amounts` are invoiced.
+    """
+    amount: Optional[Decimal] = Field(None, ge=0)
+    job_amounts: dict[int, Annotated[Decimal, Field(ge=0)]] = {}
+    tax_rate: Decimal = Field(Decimal("0"), ge=0)
+    completed_from: Optional[datetime] = None
+    completed_to: Optional[datetime] = None
+    due_in_days: Optional[int] = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def require_pricing(self) -> "InvoiceGenerateRequest":
+        if self.amount is None and not self.job_amounts:
+            raise ValueError("Either amount or job_amounts is required")
+        return self
+
+
+class InvoiceGenerateResult(BaseModel):
+    """Result of an invoice generation run."""
+    created: int
+    first_invoice_number: Optional[str] = None
+    last_invoice_number: Optional[str] = None
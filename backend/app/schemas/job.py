@@ -45,12 +45,31 @@ class JobUpdate(BaseModel):
     completed_date: Optional[datetime] = None
 
 
+class JobBatchUpdateItem(JobUpdate):
+    """A single job update within a batch, ordered by the client's `updated_at`."""
+    id: int
+    updated_at: Optional[datetime] = None
+
+
+class JobBatchUpdate(BaseModel):
+    """Schema for updating many jobs in one request."""
+    updates: list[JobBatchUpdateItem]
+
+
 class Job(JobBase):
     """Job schema for responses."""
     id: int
     completed_date: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+    deleted_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
+
+
+class JobBatchUpdateResult(BaseModel):
+    """Result of a batch job update."""
+    updated: list[Job]
+    not_found: list[int]
+    failed: list[int] = []
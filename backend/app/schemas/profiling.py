@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+
+class ProfileSummary(BaseModel):
+    """Summary of a captured request profile."""
+    id: str
+    method: str
+    path: str
+    started_at: datetime
+    duration_ms: float
+    cpu_samples: int
+    allocated_bytes: int
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from app.schemas.account import Account
+from app.schemas.technician import Technician
+from app.schemas.job import Job
+from app.schemas.invoice import Invoice
+
+
+class SyncChanges(BaseModel):
+    """Rows of an account changed or deleted after a change token.
+
+    Deleted rows are included as tombstones with `deleted_at` set. Pass
+    `next_token` as `since` on the next request; keep paging while
+    `has_more` is true.
+    """
+    accounts: list[Account] = []
+    technicians: list[Technician] = []
+    jobs: list[Job] = []
+    invoices: list[Invoice] = []
+    next_token: str
+    has_more: bool
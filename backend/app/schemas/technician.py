@@ -35,6 +35,7 @@ class Technician(TechnicianBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    deleted_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Compare JSON and MessagePack response encoding for job and invoice lists.
+
+Reports the encoded size (raw, gzip and brotli) and the encode and decode
+time of a list page rendered the way the API renders it. Encoding includes
+dumping the response model: JSON dumps it to JSON-compatible data and
+renders it with `NegotiatedResponse`; MessagePack dumps it in Python mode
+and packs datetimes as Timestamps. Decoding parses the body back into
+Python data, as a client would.
+
+Usage:
+    python benchmark_serialization.py [--rows 100] [--repeat 200] [--rounds 15]
+
+Timings are the best of `--rounds` runs of `--repeat` calls each, with the
+formats measured in turn within every round so that background load affects
+them alike.
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pydantic import TypeAdapter
+from app.core.compression import _brotli
+from app.core.negotiation import NegotiatedResponse, _msgpack, packb, unpackb
+from app.schemas.invoice import Invoice, InvoiceStatus
+from app.schemas.job import Job, JobStatus
+
+
+def sample_jobs(rows: int) -> list[Job]:
+    now = datetime(2024, 6, 1, 9, 30)
+    return [
+        Job(
+            id=index,
+            account_id=1,
+            technician_id=index % 25 or None,
+            title=f"Replace condenser fan motor #{index}",
+            description="Unit is tripping the breaker on startup; customer reports rattling noise.",
+            status=JobStatus.COMPLETED if index % 3 else JobStatus.PENDING,
+            address=f"{100 + index} Market Street",
+            city="Springfield",
+            state="IL",
+            zip_code="62701",
+            scheduled_date=now + timedelta(days=index % 14),
+            completed_date=now + timedelta(days=index % 14, hours=3) if index % 3 else None,
+            created_at=now,
+            updated_at=now + timedelta(hours=index % 48),
+        )
+        for index in range(1, rows + 1)
+    ]
+
+
+def sample_invoices(rows: int) -> list[Invoice]:
+    now = datetime(2024, 6, 1, 9, 30)
+    return [
+        Invoice(
+            id=index,
+            account_id=1,
+            job_id=index,
+            invoice_number=f"INV-{index:08d}",
+            description="Labor and parts",
+            amount=Decimal("240.00"),
+            tax_amount=Decimal("19.80"),
+            total_amount=Decimal("259.80"),
+            status=InvoiceStatus.SENT,
+            issued_date=now,
+            due_date=now + timedelta(days=30),
+            notes=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(1, rows + 1)
+    ]
+
+
+def best_times(funcs: dict, repeat: int, rounds: int) -> dict:
+    """Best time per call of each function, measuring them in turn each round."""
+    best = dict.fromkeys(funcs, float("inf"))
+    for _ in range(rounds):
+        for name, func in funcs.items():
+            best[name] = min(best[name], timeit.timeit(func, number=repeat) / repeat)
+    return best
+
+
+def measure(label: str, items: list, repeat: int, rounds: int) -> None:
+    adapter = TypeAdapter(list[type(items[0])])
+    brotli = _brotli()
+
+    formats = {"json": (lambda: NegotiatedResponse(adapter.dump_python(items, mode="json")).body, json.loads)}
+    if _msgpack() is not None:
+        formats["msgpack"] = (lambda: packb(adapter.dump_python(items, mode="python")), unpackb)
+
+    print(f"\n{label} ({len(items)} rows)")
+    print(f"  {'format':<10}{'bytes':>10}{'gzip':>10}{'brotli':>10}{'encode µs':>12}{'decode µs':>12}")
+    bodies = {name: encode() for name, (encode, _) in formats.items()}
+    encode_times = best_times({name: encode for name, (encode, _) in formats.items()}, repeat, rounds)
+    decode_times = best_times(
+        {name: (lambda decode=decode, body=bodies[name]: decode(body)) for name, (_, decode) in formats.items()},
+        repeat,
+        rounds,
+    )
+    for name, body in bodies.items():
+        encode_seconds = encode_times[name]
+        decode_seconds = decode_times[name]
+        gzipped = len(gzip.compress(body, compresslevel=6))
+        brotlied = len(brotli.compress(body, quality=4)) if brotli is not None else "-"
+        print(
+            f"  {name:<10}{len(body):>10}{gzipped:>10}{brotlied:>10}"
+            f"{encode_seconds * 1e6:>12.1f}{decode_seconds * 1e6:>12.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100, help="Rows per list page")
+    parser.add_argument("--repeat", type=int, default=200, help="Encodes and decodes per timing run")
+    parser.add_argument("--rounds", type=int, default=15, help="Timing runs per format; the best is reported")
+    args = parser.parse_args()
+
+    if _msgpack() is None:
+        print("msgpack is not installed; install the `msgpack` extra to compare it")
+    measure("Jobs", sample_jobs(args.rows), args.repeat, args.rounds)
+    measure("Invoices", sample_invoices(args.rows), args.repeat, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
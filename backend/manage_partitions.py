@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Partition maintenance for the range partitioned `jobs` and `invoices` tables.
+
+    python manage_partitions.py create [--months-ahead N]
+    python manage_partitions.py archive [--older-than N] [--target parquet|cold] [--output-dir DIR]
+
+Run `create` on a schedule (e.g. daily) so next months' partitions exist
+before rows land in them, and `archive` monthly to move closed jobs and paid
+invoices out of the hot tables.
+"""
+
+import argparse
+import os
+import sys
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+def create_partitions(months_ahead: int) -> int:
+    """Create partitions for the current month and the months ahead."""
+    from app.database.engine import get_engine
+    from app.database.partitions import ensure_future_partitions
+
+    with get_engine().begin() as connection:
+        created = ensure_future_partitions(connection, months_ahead)
+    for name in created:
+        print(f"  ✓ {name}")
+    return 0
+
+
+def archive(older_than: int, target: str, output_dir: str, maintenance_role: str | None) -> int:
+    """Archive closed rows older than `older_than` months, across all accounts."""
+    from sqlalchemy import text
+    from app.database.engine import new_session
+    from app.database.archive import archive_closed_rows
+
+    db = new_session()
+    try:
+        if maintenance_role:
+            # Row-level security hides every account's rows from unscoped sessions.
+            role = db.get_bind().dialect.identifier_preparer.quote(maintenance_role)
+            db.execute(text(f"SET LOCAL ROLE {role}"))
+        counts = archive_closed_rows(db, older_than, target=target, output_dir=output_dir)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    for table_name, count in counts.items():
+        print(f"  ✓ {table_name}: {count} rows archived to {target}")
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run the requested maintenance command."""
+    from app.core.config import get_settings
+    from app.database.archive import ARCHIVE_TARGETS
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create_parser = commands.add_parser("create", help="Create upcoming monthly partitions")
+    create_parser.add_argument("--months-ahead", type=int, default=settings.partition_months_ahead)
+
+    archive_parser = commands.add_parser("archive", help="Archive closed jobs and paid invoices")
+    archive_parser.add_argument("--older-than", type=int, default=settings.archive_after_months)
+    archive_parser.add_argument("--target", choices=ARCHIVE_TARGETS, default="parquet")
+    archive_parser.add_argument("--output-dir", default=settings.archive_dir)
+
+    args = parser.parse_args()
+    if args.command == "create":
+        return create_partitions(args.months_ahead)
+    return archive(args.older_than, args.target, args.output_dir, settings.maintenance_role)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.core.config import get_settings
 from app.database.engine import Base
+import app.models  # noqa: F401 - registers the models on Base.metadata
 
 config = context.config
 
@@ -0,0 +1,152 @@
+"""Partition jobs and invoices by month of created_at
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+
+Converts `jobs` and `invoices` into native Postgres RANGE partitioned tables
+with one partition per month of `created_at`, plus a default partition, and
+creates the plain `jobs_archive` / `invoices_archive` tables used as cold
+storage by `manage_partitions.py archive --target cold`.
+
+Postgres requires every unique constraint on a partitioned table to include
+the partition key, so:
+  * the primary keys become (id, created_at); ids still come from the
+    original sequences and stay unique in practice,
+  * `invoice_number` is unique per (invoice_number, created_at),
+  * the `invoices.job_id -> jobs.id` foreign key is dropped, as it can no
+    longer reference `jobs(id)` alone.
+
+Other dialects are left untouched.
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month_index = value.year * 12 + (value.month - 1) + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+def _create_partitions(table: str, start: datetime, end: datetime) -> None:
+    month = _month_start(start)
+    while month < end:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        )
+        month = upper
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def _partition(table: str, unique_columns: list[str], foreign_keys: list[tuple[str, str]], indexes: list[str]) -> None:
+    """Swap `table` for a partitioned copy and move its rows across."""
+    legacy = f"{table}_unpartitioned"
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+    for column in unique_columns:
+        op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_{column}_key TO {legacy}_{column}_key")
+    for column in indexes:
+        op.execute(f"ALTER INDEX ix_{table}_{column} RENAME TO ix_{legacy}_{column}")
+
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) "
+        f"PARTITION BY RANGE (created_at)"
+    )
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+    for column in unique_columns:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_key UNIQUE ({column}, created_at)")
+    for column, target in foreign_keys:
+        op.execute(f"ALTER TABLE {table} ADD FOREIGN KEY ({column}) REFERENCES {target}")
+    for column in indexes:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+    # Keep the id sequence alive when the legacy table is dropped.
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    oldest = op.get_bind().execute(sa.text(f"SELECT min(created_at) FROM {legacy}")).scalar()
+    now = datetime.utcnow()
+    _create_partitions(table, oldest or now, _add_months(_month_start(now), MONTHS_AHEAD + 1))
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+    op.execute(f"DROP TABLE {legacy}")
+    op.execute(f"CREATE TABLE {table}_archive (LIKE {table} INCLUDING DEFAULTS)")
+    op.execute(f"ALTER TABLE {table}_archive ADD PRIMARY KEY (id)")
+
+
+def _unpartition(table: str, unique_columns: list[str], foreign_keys: list[tuple[str, str]], indexes: list[str]) -> None:
+    """Swap a partitioned `table` back for a plain table, keeping its rows."""
+    partitioned = f"{table}_partitioned"
+    op.execute(f"DROP TABLE {table}_archive")
+    op.execute(f"ALTER TABLE {table} RENAME TO {partitioned}")
+    op.execute(f"ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey")
+    for column in unique_columns:
+        op.execute(f"ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_{column}_key TO {partitioned}_{column}_key")
+    for column in indexes:
+        op.execute(f"ALTER INDEX ix_{table}_{column} RENAME TO ix_{partitioned}_{column}")
+
+    op.execute(f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS)")
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"INSERT INTO {table} SELECT * FROM {partitioned}")
+    op.execute(f"DROP TABLE {partitioned}")
+
+    for column in unique_columns:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_key UNIQUE ({column})")
+    for column, target in foreign_keys:
+        op.execute(f"ALTER TABLE {table} ADD FOREIGN KEY ({column}) REFERENCES {target}")
+    for column in indexes:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE invoices DROP CONSTRAINT invoices_job_id_fkey")
+    _partition(
+        "jobs",
+        unique_columns=[],
+        foreign_keys=[("account_id", "accounts (id)"), ("technician_id", "technicians (id)")],
+        indexes=["account_id", "status"],
+    )
+    _partition(
+        "invoices",
+        unique_columns=["invoice_number"],
+        foreign_keys=[("account_id", "accounts (id)")],
+        indexes=["account_id", "invoice_number", "status"],
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _unpartition(
+        "invoices",
+        unique_columns=["invoice_number"],
+        foreign_keys=[("account_id", "accounts (id)")],
+        indexes=["account_id", "invoice_number", "status"],
+    )
+    _unpartition(
+        "jobs",
+        unique_columns=[],
+        foreign_keys=[("account_id", "accounts (id)"), ("technician_id", "technicians (id)")],
+        indexes=["account_id", "status"],
+    )
+    op.execute(
+        "ALTER TABLE invoices ADD CONSTRAINT invoices_job_id_fkey "
+        "FOREIGN KEY (job_id) REFERENCES jobs (id)"
+    )
@@ -0,0 +1,53 @@
+"""Row-level security policies scoping tenant tables by account_id
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+Enables (and forces, so the owning role is covered too) row-level security
+on every table carrying `account_id`. Rows are visible only when their
+`account_id` matches the transaction-local `app.tenant` setting, which the
+application sets per transaction when TENANT_RLS_ENABLED is true.
+
+Sessions that never set `app.tenant` (migrations, partition maintenance,
+cross-account batch jobs) keep seeing every row, so this migration is safe
+to apply before RLS is switched on in the application.
+
+Other dialects are left untouched.
+"""
+from alembic import op
+
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+TENANT_TABLES = ("technicians", "jobs", "invoices")
+
+TENANT_PREDICATE = (
+    "NULLIF(current_setting('app.tenant', true), '') IS NULL "
+    "OR account_id = NULLIF(current_setting('app.tenant', true), '')::integer"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TENANT_TABLES:
+        op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY")
+        op.execute(
+            f"CREATE POLICY {table}_tenant_isolation ON {table} "
+            f"USING ({TENANT_PREDICATE}) WITH CHECK ({TENANT_PREDICATE})"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TENANT_TABLES:
+        op.execute(f"DROP POLICY {table}_tenant_isolation ON {table}")
+        op.execute(f"ALTER TABLE {table} NO FORCE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} DISABLE ROW LEVEL SECURITY")
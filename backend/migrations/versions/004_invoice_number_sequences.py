@@ -0,0 +1,28 @@
+"""Invoice number sequence for generated invoices
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    sequences = op.create_table(
+        'invoice_number_sequences',
+        sa.Column('name', sa.String(50), nullable=False),
+        sa.Column('next_value', sa.BigInteger(), nullable=False, server_default='1'),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(sequences, [{'name': 'invoice', 'next_value': 1}])
+
+
+def downgrade() -> None:
+    op.drop_table('invoice_number_sequences')
@@ -0,0 +1,64 @@
+"""Soft delete tombstones and change sequence for incremental sync
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+Adds `deleted_at` (tombstone timestamp) and `change_seq` to accounts,
+technicians, jobs and invoices. `change_seq` is drawn from the shared
+`change_seq` sequence on every insert and update; existing rows are
+numbered as the column is added. Tenant tables get an
+`(account_id, change_seq)` index serving `GET /api/sync`.
+
+On Postgres the `jobs_archive` / `invoices_archive` cold storage tables get
+the same columns (without the default), so archived rows keep their values.
+
+Requires PostgreSQL: other dialects have no sequences to draw `change_seq`
+from, and are not supported from this revision on.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+SYNCED_TABLES = ("accounts", "technicians", "jobs", "invoices")
+TENANT_TABLES = ("technicians", "jobs", "invoices")
+ARCHIVE_TABLES = ("jobs_archive", "invoices_archive")
+
+
+def _require_postgresql() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect != "postgresql":
+        raise RuntimeError(f"Migration 005 requires PostgreSQL, not {dialect}")
+
+
+def upgrade() -> None:
+    _require_postgresql()
+    op.execute(sa.schema.CreateSequence(sa.Sequence("change_seq")))
+    for table in SYNCED_TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(), nullable=True))
+        op.add_column(table, sa.Column(
+            'change_seq', sa.BigInteger(), nullable=False, server_default=sa.text("nextval('change_seq')")
+        ))
+    for table in TENANT_TABLES:
+        op.create_index(f'ix_{table}_account_id_change_seq', table, ['account_id', 'change_seq'])
+    for table in ARCHIVE_TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(), nullable=True))
+        op.add_column(table, sa.Column('change_seq', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    _require_postgresql()
+    for table in ARCHIVE_TABLES:
+        op.drop_column(table, 'change_seq')
+        op.drop_column(table, 'deleted_at')
+
+    for table in TENANT_TABLES:
+        op.drop_index(f'ix_{table}_account_id_change_seq', table_name=table)
+    for table in SYNCED_TABLES:
+        op.drop_column(table, 'change_seq')
+        op.drop_column(table, 'deleted_at')
+    op.execute(sa.schema.DropSequence(sa.Sequence("change_seq")))
@@ -0,0 +1,60 @@
+"""Keep invoice numbers globally unique on partitioned invoices
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+Partitioning (migration `002`) could only keep `invoice_number` unique per
+(invoice_number, created_at). This adds a plain `invoice_numbers` table
+keyed by invoice number, filled by a trigger on every insert into
+`invoices` and every change of an invoice's number, so a duplicate fails
+with a unique violation whichever partition it lands in. Numbers of
+archived invoices stay reserved.
+
+Other dialects keep the plain unique constraint and are left untouched.
+"""
+from alembic import op
+
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE TABLE invoice_numbers (invoice_number VARCHAR(50) PRIMARY KEY)")
+    op.execute(
+        "INSERT INTO invoice_numbers (invoice_number) "
+        "SELECT invoice_number FROM invoices UNION SELECT invoice_number FROM invoices_archive"
+    )
+    op.execute("""
+        CREATE FUNCTION reserve_invoice_number() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                IF NEW.invoice_number = OLD.invoice_number THEN
+                    RETURN NULL;
+                END IF;
+                DELETE FROM invoice_numbers WHERE invoice_number = OLD.invoice_number;
+            END IF;
+            INSERT INTO invoice_numbers (invoice_number) VALUES (NEW.invoice_number);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER invoices_reserve_invoice_number "
+        "AFTER INSERT OR UPDATE OF invoice_number ON invoices "
+        "FOR EACH ROW EXECUTE FUNCTION reserve_invoice_number()"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP TRIGGER invoices_reserve_invoice_number ON invoices")
+    op.execute("DROP FUNCTION reserve_invoice_number()")
+    op.execute("DROP TABLE invoice_numbers")
@@ -0,0 +1,73 @@
+"""Fail-closed tenant row-level security and a maintenance role
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+Replaces the policies from migration `003`, which showed every row to
+sessions that never set `app.tenant`, with policies that show such sessions
+no rows. The application sets `app.tenant` on every tenant-scoped
+transaction.
+
+Cross-account maintenance (archival) instead runs as `fsm_maintenance`, a
+NOLOGIN role with BYPASSRLS and data access to the application tables;
+grant it to the role running `manage_partitions.py`. Creating a BYPASSRLS
+role requires running this migration as a superuser.
+
+Other dialects are left untouched.
+"""
+from alembic import op
+
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+TENANT_TABLES = ("technicians", "jobs", "invoices")
+MAINTENANCE_ROLE = "fsm_maintenance"
+
+TENANT_PREDICATE = "account_id = NULLIF(current_setting('app.tenant', true), '')::integer"
+
+FAIL_OPEN_TENANT_PREDICATE = (
+    "NULLIF(current_setting('app.tenant', true), '') IS NULL "
+    "OR account_id = NULLIF(current_setting('app.tenant', true), '')::integer"
+)
+
+
+def _replace_policies(predicate: str) -> None:
+    for table in TENANT_TABLES:
+        op.execute(f"DROP POLICY {table}_tenant_isolation ON {table}")
+        op.execute(
+            f"CREATE POLICY {table}_tenant_isolation ON {table} "
+            f"USING ({predicate}) WITH CHECK ({predicate})"
+        )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _replace_policies(TENANT_PREDICATE)
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT FROM pg_roles WHERE rolname = '{MAINTENANCE_ROLE}') THEN
+                CREATE ROLE {MAINTENANCE_ROLE} NOLOGIN BYPASSRLS;
+            END IF;
+        END
+        $$
+    """)
+    op.execute(f"GRANT USAGE ON SCHEMA public TO {MAINTENANCE_ROLE}")
+    op.execute(f"GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO {MAINTENANCE_ROLE}")
+    op.execute(f"GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO {MAINTENANCE_ROLE}")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(f"REVOKE ALL ON ALL SEQUENCES IN SCHEMA public FROM {MAINTENANCE_ROLE}")
+    op.execute(f"REVOKE ALL ON ALL TABLES IN SCHEMA public FROM {MAINTENANCE_ROLE}")
+    op.execute(f"REVOKE USAGE ON SCHEMA public FROM {MAINTENANCE_ROLE}")
+    op.execute(f"DROP ROLE {MAINTENANCE_ROLE}")
+    _replace_policies(FAIL_OPEN_TENANT_PREDICATE)
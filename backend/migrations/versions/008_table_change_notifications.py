@@ -0,0 +1,52 @@
+"""Notify table changes for cross-process query cache invalidation
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+Adds statement-level triggers sending `NOTIFY table_changes, '<table>'`
+after every INSERT, UPDATE, DELETE or TRUNCATE on the cached tables,
+whichever connection or process made the write. Notifications are only
+delivered once the writing transaction commits. Each application worker
+listens on the channel and invalidates the query cache entries reading
+that table.
+
+Other dialects are left untouched.
+"""
+from alembic import op
+
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+NOTIFIED_TABLES = ("accounts", "technicians", "jobs", "invoices")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("""
+        CREATE FUNCTION notify_table_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('table_changes', TG_TABLE_NAME);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    for table in NOTIFIED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_notify_change "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change()"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in NOTIFIED_TABLES:
+        op.execute(f"DROP TRIGGER {table}_notify_change ON {table}")
+    op.execute("DROP FUNCTION notify_table_change()")
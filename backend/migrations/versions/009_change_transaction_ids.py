@@ -0,0 +1,58 @@
+"""Record the writing transaction of each change for a safe sync watermark
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+Adds `change_xid`, the id of the transaction that last wrote the row, to
+accounts, technicians, jobs and invoices. `change_seq` values are drawn
+when a row is written but only become visible when the transaction
+commits, so a sync ordered by `change_seq` alone could advance past a
+long transaction's rows before they were visible. `GET /api/sync` now
+orders changes by `(change_xid, change_seq)` and only returns those of
+transactions older than every running one. Existing rows get the
+migration's transaction id. The `(account_id, change_seq)` indexes are
+replaced by `(account_id, change_xid, change_seq)`.
+
+The cold storage archive tables get the column too (without the default).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+SYNCED_TABLES = ("accounts", "technicians", "jobs", "invoices")
+TENANT_TABLES = ("technicians", "jobs", "invoices")
+ARCHIVE_TABLES = ("jobs_archive", "invoices_archive")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in SYNCED_TABLES:
+        op.add_column(table, sa.Column(
+            'change_xid', sa.BigInteger(), nullable=False,
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+        ))
+    for table in TENANT_TABLES:
+        op.drop_index(f'ix_{table}_account_id_change_seq', table_name=table)
+        op.create_index(f'ix_{table}_account_id_change_xid', table, ['account_id', 'change_xid', 'change_seq'])
+    for table in ARCHIVE_TABLES:
+        op.add_column(table, sa.Column('change_xid', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in ARCHIVE_TABLES:
+        op.drop_column(table, 'change_xid')
+    for table in TENANT_TABLES:
+        op.drop_index(f'ix_{table}_account_id_change_xid', table_name=table)
+        op.create_index(f'ix_{table}_account_id_change_seq', table, ['account_id', 'change_seq'])
+    for table in SYNCED_TABLES:
+        op.drop_column(table, 'change_xid')
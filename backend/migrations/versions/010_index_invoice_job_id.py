@@ -0,0 +1,24 @@
+"""Index invoices by job
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+The `Invoice.job_id` index declared by the model was never created. It
+serves the "job has no invoice yet" checks of invoice generation and
+archival, which lost the foreign key's supporting lookups in migration 002.
+"""
+from alembic import op
+
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_invoices_job_id', 'invoices', ['job_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_invoices_job_id', table_name='invoices')
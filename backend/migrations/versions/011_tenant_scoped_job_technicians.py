@@ -0,0 +1,58 @@
+"""Tie job technicians to the job's account
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+Foreign key checks bypass row-level security, so `jobs.technician_id` could
+reference another account's technician. The single-column foreign key is
+replaced by `(account_id, technician_id) -> technicians (account_id, id)`,
+which only accepts technicians of the job's own account.
+
+Fails if existing jobs already reference another account's technician;
+those have to be corrected first. Other dialects are left untouched.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    mismatched = bind.execute(sa.text(
+        "SELECT jobs.id FROM jobs JOIN technicians ON technicians.id = jobs.technician_id "
+        "WHERE technicians.account_id <> jobs.account_id ORDER BY jobs.id LIMIT 10"
+    )).scalars().all()
+    if mismatched:
+        raise RuntimeError(
+            "Jobs reference technicians of another account (first ids: "
+            f"{', '.join(map(str, mismatched))}); fix them before upgrading"
+        )
+
+    op.execute(
+        "ALTER TABLE technicians ADD CONSTRAINT technicians_account_id_id_key UNIQUE (account_id, id)"
+    )
+    op.execute("ALTER TABLE jobs DROP CONSTRAINT jobs_technician_id_fkey")
+    op.execute(
+        "ALTER TABLE jobs ADD CONSTRAINT jobs_account_id_technician_id_fkey "
+        "FOREIGN KEY (account_id, technician_id) REFERENCES technicians (account_id, id)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE jobs DROP CONSTRAINT jobs_account_id_technician_id_fkey")
+    op.execute(
+        "ALTER TABLE jobs ADD CONSTRAINT jobs_technician_id_fkey "
+        "FOREIGN KEY (technician_id) REFERENCES technicians (id)"
+    )
+    op.execute("ALTER TABLE technicians DROP CONSTRAINT technicians_account_id_id_key")
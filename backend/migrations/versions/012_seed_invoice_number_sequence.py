@@ -0,0 +1,48 @@
+"""Start the invoice number counter after existing generated-style numbers
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+Migration `004` started the counter at 1, so generation failed with a unique
+violation, on every retry, once it reached a number that an existing invoice
+already used (e.g. an imported `INV-00000001`). This moves the counter past
+the highest number in `invoice_numbers` (live and archived invoices) made of
+`INVOICE_NUMBER_PREFIX` followed by digits. It never moves the counter back.
+
+Other dialects are left untouched.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import get_settings
+
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    prefix = get_settings().invoice_number_prefix
+    bind.execute(
+        sa.text("""
+            INSERT INTO invoice_number_sequences (name, next_value)
+            SELECT 'invoice', COALESCE(max(substr(invoice_number, :start)::bigint), 0) + 1
+            FROM invoice_numbers
+            WHERE starts_with(invoice_number, :prefix)
+              AND substr(invoice_number, :start) ~ '^[0-9]{1,18}$'
+            ON CONFLICT (name) DO UPDATE
+            SET next_value = GREATEST(invoice_number_sequences.next_value, EXCLUDED.next_value)
+        """),
+        {"prefix": prefix, "start": len(prefix) + 1},
+    )
+
+
+def downgrade() -> None:
+    # A counter past the existing numbers is valid for revision 011 as well.
+    pass
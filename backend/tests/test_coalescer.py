@@ -0,0 +1,30 @@
+from datetime import datetime
+from app.database.coalescer import _PendingUpdate
+
+
+def at(second: int) -> datetime:
+    return datetime(2024, 6, 1, 9, 0, second)
+
+
+def test_merge_keeps_latest_change_per_field():
+    pending = _PendingUpdate()
+    pending.merge({"status": "completed"}, at(10))
+    pending.merge({"title": "B"}, at(5))
+    pending.merge({"title": "C"}, at(7))
+    assert pending.changes == {"status": "completed", "title": "C"}
+    assert pending.changed_at == {"status": at(10), "title": at(7)}
+
+
+def test_merge_ignores_older_change_of_a_field():
+    pending = _PendingUpdate()
+    pending.merge({"title": "new", "city": "Springfield"}, at(9))
+    pending.merge({"title": "old", "state": "IL"}, at(3))
+    assert pending.changes == {"title": "new", "city": "Springfield", "state": "IL"}
+    assert pending.changed_at == {"title": at(9), "city": at(9), "state": at(3)}
+
+
+def test_merge_later_submission_wins_a_tie():
+    pending = _PendingUpdate()
+    pending.merge({"title": "first"}, at(4))
+    pending.merge({"title": "second"}, at(4))
+    assert pending.changes == {"title": "second"}
@@ -0,0 +1,24 @@
+import pytest
+from validate_setup import (
+    IMPORT_TIME_BUDGETS, MODELS_ONLY_FORBIDDEN_IMPORTS, baseline_import_time, fastest_import_time,
+    measure_import_time,
+)
+
+
+@pytest.fixture(scope="module")
+def baseline_ms():
+    return baseline_import_time()
+
+
+@pytest.mark.parametrize("statement,budget", IMPORT_TIME_BUDGETS)
+def test_import_time_within_budget(statement, budget, baseline_ms):
+    elapsed_ms, _ = fastest_import_time(statement)
+    assert elapsed_ms <= budget * baseline_ms, (
+        f"{statement}: {elapsed_ms:.0f}ms exceeds budget of {budget}x baseline ({budget * baseline_ms:.0f}ms)"
+    )
+
+
+def test_models_only_import_skips_web_stack():
+    statement = IMPORT_TIME_BUDGETS[0][0]
+    _, modules = measure_import_time(statement)
+    assert not modules & set(MODELS_ONLY_FORBIDDEN_IMPORTS)
@@ -0,0 +1,25 @@
+from decimal import Decimal
+from app.database.invoice_generation import compute_totals
+
+
+def test_compute_totals_rounds_half_up_to_cents():
+    assert compute_totals(Decimal("99.995"), Decimal("0")) == (Decimal("100.00"), Decimal("0.00"), Decimal("100.00"))
+    assert compute_totals(Decimal("10.004"), Decimal("0")) == (Decimal("10.00"), Decimal("0.00"), Decimal("10.00"))
+
+
+def test_compute_totals_taxes_the_rounded_amount():
+    # 8.25% of 19.99 is 1.649175.
+    assert compute_totals(Decimal("19.99"), Decimal("0.0825")) == (
+        Decimal("19.99"), Decimal("1.65"), Decimal("21.64"),
+    )
+    # 100.005 rounds to 100.01 first; 50% of that is 50.005, which rounds to 50.01.
+    assert compute_totals(Decimal("100.005"), Decimal("0.5")) == (
+        Decimal("100.01"), Decimal("50.01"), Decimal("150.02"),
+    )
+
+
+def test_compute_totals_total_is_exact_sum_of_rounded_parts():
+    for amount in ("0.01", "1.10", "33.33", "1234.565"):
+        amount, tax_amount, total_amount = compute_totals(Decimal(amount), Decimal("0.0725"))
+        assert total_amount == amount + tax_amount
+        assert total_amount.as_tuple().exponent == -2
@@ -118,6 +118,102 @@ def validate_imports() -> bool:
     return all_good
 
 
+# Import-time budgets for each process entry point, as multiples of a bare
+# `import sqlalchemy` measured in the same run, so they hold on slow and fast
+# machines alike. Times are cumulative `app.*` import time as reported by
+# `python -X importtime`; both entry points currently take about half their
+# budget.
+IMPORT_TIME_BASELINE = "import sqlalchemy"
+IMPORT_TIME_BUDGETS = [
+    # Alembic (migrations/env.py) and maintenance scripts: models only.
+    ("import app.database.engine, app.models", 3.5),
+    # Uvicorn worker: the application factory, including lazily loaded routers.
+    ("from app.main import create_app; create_app()", 6.0),
+]
+
+# Heavy modules that the models-only entry point must not load.
+MODELS_ONLY_FORBIDDEN_IMPORTS = ["fastapi", "email_validator", "app.api", "app.schemas"]
+
+
+def measure_import_time(statement: str, package: str = "app") -> tuple[float, set[str]]:
+    """Run `statement` in a fresh interpreter under `-X importtime`.
+
+    Returns the cumulative import time of top-level `package` modules in
+    milliseconds, and the names of every module imported.
+    """
+    import subprocess
+    
+    env = dict(os.environ)
+    # Only imported, never connected to.
+    env.setdefault("DATABASE_URL", "postgresql+psycopg2://validate-setup@localhost/validate_setup")
+    env.setdefault("FSM_API_KEY", "validate-setup")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        check=True,
+    )
+    
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        module = name.strip()
+        modules.add(module)
+        # Top-level imports are indented by exactly one space.
+        if module.split(".")[0] == package and len(name) - len(name.lstrip()) == 1:
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def fastest_import_time(statement: str, package: str = "app", runs: int = 3) -> tuple[float, set[str]]:
+    """Fastest of a few `measure_import_time` runs, to reduce noise from the machine."""
+    return min((measure_import_time(statement, package) for _ in range(runs)), key=lambda run: run[0])
+
+
+def baseline_import_time() -> float:
+    """Import time of `IMPORT_TIME_BASELINE`, the unit of `IMPORT_TIME_BUDGETS`, in milliseconds."""
+    elapsed_ms, _ = fastest_import_time(IMPORT_TIME_BASELINE, package="sqlalchemy")
+    return elapsed_ms
+
+
+def validate_import_time() -> bool:
+    """Validate cold-start import time against the per-entry-point budgets."""
+    print("\nChecking import-time budget...")
+    
+    try:
+        import sqlalchemy  # noqa: F401
+        import fastapi  # noqa: F401
+    except ImportError:
+        print("  - Skipped: dependencies are not installed")
+        return True
+    
+    all_good = True
+    baseline_ms = baseline_import_time()
+    print(f"  - Baseline {IMPORT_TIME_BASELINE}: {baseline_ms:.0f}ms")
+    
+    for statement, budget in IMPORT_TIME_BUDGETS:
+        budget_ms = budget * baseline_ms
+        elapsed_ms, modules = fastest_import_time(statement)
+        if elapsed_ms <= budget_ms:
+            print(f"  ✓ {statement}: {elapsed_ms:.0f}ms (budget {budget}x baseline, {budget_ms:.0f}ms)")
+        else:
+            print(f"  ✗ {statement}: {elapsed_ms:.0f}ms exceeds budget of {budget}x baseline ({budget_ms:.0f}ms)")
+            all_good = False
+        
+        if statement == IMPORT_TIME_BUDGETS[0][0]:
+            for forbidden in MODELS_ONLY_FORBIDDEN_IMPORTS:
+                if forbidden in modules:
+                    print(f"  ✗ {statement}: imports {forbidden}")
+                    all_good = False
+    
+    return all_good
+
+
 def main():
     """Run all validations."""
     print("=" * 60)
@@ -130,6 +226,7 @@ def main():
     results.append(("Project Structure", validate_structure()))
     results.append(("Python Syntax", validate_python_syntax()))
     results.append(("Import Paths", validate_imports()))
+    results.append(("Import-Time Budget", validate_import_time()))
     
     print("\n" + "=" * 60)
     print("Validation Summary")
@@ -151,7 +248,7 @@ def main():
         print("1. Create a .env file with your configuration")
         print("2. Install dependencies: poetry install")
         print("3. Apply migrations: alembic upgrade head")
-        print("4. Start the server: uvicorn app.main:app --reload")
+        print("4. Start the server: uvicorn --factory app.main:create_app --reload")
         return 0
     else:
         print("\n✗ Some validations failed. Please check the output above.")
@@ -0,0 +1,16 @@
+#!/bin/sh
+# Creates the role the backend connects as. It owns nothing and is neither a
+# superuser nor BYPASSRLS, so the tenant row-level security policies apply to
+# it. Migrations keep running as $POSTGRES_USER, which owns the tables; the
+# default privileges below cover every table and sequence they create.
+# Runs once, when the data volume is first initialized.
+set -e
+
+psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-EOSQL
+	CREATE ROLE "$APP_DB_USER" LOGIN PASSWORD '$APP_DB_PASSWORD';
+	GRANT USAGE ON SCHEMA public TO "$APP_DB_USER";
+	ALTER DEFAULT PRIVILEGES FOR ROLE "$POSTGRES_USER" IN SCHEMA public
+	    GRANT SELECT, INSERT, UPDATE, DELETE ON TABLES TO "$APP_DB_USER";
+	ALTER DEFAULT PRIVILEGES FOR ROLE "$POSTGRES_USER" IN SCHEMA public
+	    GRANT USAGE, SELECT ON SEQUENCES TO "$APP_DB_USER";
+EOSQL